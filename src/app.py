@@ -59,6 +59,7 @@ from src.utils.execution_scope import build_session_scope
 from src.utils.file_downloader import (
     FileDownloadError,
     FileTooLargeError,
+    close_http_session,
     download_slack_file,
 )
 from src.utils.formatters.command import error_message
@@ -247,11 +248,12 @@ async def shutdown(
     claude_executor: ClaudeExecutor,
     codex_executor: CodexExecutor | None = None,
 ) -> None:
-    """Graceful shutdown: cleanup active processes."""
+    """Graceful shutdown: cleanup active processes and shared HTTP connections."""
     logger.info("Shutting down - cleaning up active processes...")
     await claude_executor.shutdown()
     if codex_executor:
         await codex_executor.shutdown()
+    await close_http_session()
     logger.info("All processes terminated")
 
 
@@ -30,6 +30,7 @@ CLAUDE_TOOL_SUMMARY_RULES = build_tool_summary_rules(
 class ToolActivity(BaseToolActivity):
     """Claude-specific tool activity metadata."""
 
+    __slots__ = ()
     SUMMARY_RULES = CLAUDE_TOOL_SUMMARY_RULES
 
 
@@ -36,6 +36,7 @@ CODEX_TOOL_SUMMARY_RULES = build_tool_summary_rules(
 class ToolActivity(BaseToolActivity):
     """Codex-specific tool activity metadata."""
 
+    __slots__ = ()
     SUMMARY_RULES = CODEX_TOOL_SUMMARY_RULES
 
 
@@ -1,6 +1,7 @@
 """Codex app-server executor using subprocess JSON-RPC over stdio."""
 
 import asyncio
+import functools
 import json
 import time
 from dataclasses import dataclass, field
@@ -61,6 +62,18 @@ class _ActiveTurnState:
     started_at: float = field(default_factory=time.monotonic)
 
 
+@functools.lru_cache(maxsize=4)
+def _read_default_instructions(path: str, mtime_ns: int, size: int) -> str:
+    """Read an instructions file; cached per (path, mtime, size) so edits are picked up."""
+    return Path(path).read_text(encoding="utf-8").strip()
+
+
+def _load_default_instructions(path: Path) -> str:
+    """Return the stripped contents of the default instructions file at ``path``."""
+    stat_result = path.stat()
+    return _read_default_instructions(str(path), stat_result.st_mtime_ns, stat_result.st_size)
+
+
 class _AppServerConnection:
     """Persistent Codex app-server JSON-RPC connection."""
 
@@ -1421,7 +1434,7 @@ class SubprocessExecutor(ProcessExecutorBase):
 
         preamble_path = Path(config.CODEX_DEFAULT_INSTRUCTIONS_FILE).expanduser()
         try:
-            preamble = preamble_path.read_text(encoding="utf-8").strip()
+            preamble = _load_default_instructions(preamble_path)
         except FileNotFoundError:
             logger.debug(f"{log_prefix}No default Codex instructions file at {preamble_path}")
             return prompt
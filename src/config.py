@@ -1,4 +1,5 @@
 import functools
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
@@ -182,6 +183,19 @@ EFFORT_LEVELS: tuple[str, ...] = ("low", "medium", "high", "xhigh")
 CLAUDE_EFFORT_LEVELS: tuple[str, ...] = ("low", "medium", "high", "max", "auto")
 
 
+# Codex effort suffixes, matched case-insensitively in a single pass.
+_CODEX_EFFORT_SUFFIX_RE = re.compile(r"-(extra[-_]?high|xhigh|medium|high|low)$", re.IGNORECASE)
+_CODEX_EFFORT_LEVELS_BY_SUFFIX = {
+    "extra-high": "xhigh",
+    "extra_high": "xhigh",
+    "extrahigh": "xhigh",
+    "xhigh": "xhigh",
+    "medium": "medium",
+    "high": "high",
+    "low": "low",
+}
+
+
 def parse_model_effort(model: str) -> tuple[str, Optional[str]]:
     """Parse effort suffix from a Codex model name.
 
@@ -197,20 +211,10 @@ def parse_model_effort(model: str) -> tuple[str, Optional[str]]:
         (base_model, effort_level) — effort_level is None if no suffix found.
     """
     model_clean = model.strip()
-    model_lower = model_clean.lower()
-    suffix_map = {
-        "-extra-high": "xhigh",
-        "-extra_high": "xhigh",
-        "-extrahigh": "xhigh",
-        "-xhigh": "xhigh",
-        "-medium": "medium",
-        "-high": "high",
-        "-low": "low",
-    }
-    for suffix, level in suffix_map.items():
-        if model_lower.endswith(suffix):
-            return model_clean[: -len(suffix)], level
-    return model_clean, None
+    match = _CODEX_EFFORT_SUFFIX_RE.search(model_clean)
+    if match is None:
+        return model_clean, None
+    return model_clean[: match.start()], _CODEX_EFFORT_LEVELS_BY_SUFFIX[match.group(1).lower()]
 
 
 def parse_claude_model_effort(model: str) -> tuple[str, Optional[str]]:
@@ -252,6 +256,21 @@ def looks_like_codex_model(model_name: str) -> bool:
     return normalized.startswith("gpt-") or normalized.startswith("codex")
 
 
+@functools.lru_cache(maxsize=64)
+def _backend_for_known_model(model_lower: str) -> Optional[str]:
+    """Return the backend for a built-in Claude/Codex model name, else None.
+
+    Only consults the static model tables, so results are safe to cache; the
+    registry and prefix fallbacks in ``get_backend_for_model`` stay uncached
+    because discovered models can change at runtime.
+    """
+    if model_lower in CLAUDE_MODELS:
+        return "claude"
+    if is_supported_codex_model(model_lower):
+        return "codex"
+    return None
+
+
 def get_backend_for_model(model: Optional[str]) -> str:
     """Determine which backend to use based on the model name.
 
@@ -271,10 +290,9 @@ def get_backend_for_model(model: Optional[str]) -> str:
     model_lower = model.lower()
 
     # Check exact matches first
-    if model_lower in CLAUDE_MODELS:
-        return "claude"
-    if is_supported_codex_model(model_lower):
-        return "codex"
+    known_backend = _backend_for_known_model(model_lower)
+    if known_backend is not None:
+        return known_backend
 
     # Try registry first (handles all backends including Gemini)
     if registry.backend_ids:
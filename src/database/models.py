@@ -3,9 +3,24 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
+
 from src.config import config, get_backend_for_model
 
 
+def _json_loads(raw: str) -> Any:
+    """Decode a stored JSON column, preferring orjson.
+
+    Rows are written with stdlib ``json.dumps``, which may emit ``NaN``/``Infinity``
+    or integers wider than 64 bits. orjson rejects those, so such payloads are
+    decoded with ``json.loads`` instead.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
 @dataclass
 class Session:
     id: Optional[int] = None
@@ -35,7 +50,7 @@ class Session:
             claude_session_id=row[4],
             permission_mode=row[5],
             model=row[8],
-            added_dirs=json.loads(row[9]) if row[9] else [],
+            added_dirs=_json_loads(row[9]) if row[9] else [],
             created_at=datetime.fromisoformat(row[6]) if row[6] else datetime.now(),
             last_active=datetime.fromisoformat(row[7]) if row[7] else datetime.now(),
             codex_session_id=row[10],
@@ -64,7 +79,7 @@ class Session:
         return get_backend_for_model(self.model)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandHistory:
     id: Optional[int] = None
     session_id: int = 0
@@ -119,7 +134,7 @@ class CommandHistory:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ParallelJob:
     id: Optional[int] = None
     session_id: int = 0
@@ -141,8 +156,8 @@ class ParallelJob:
             channel_id=row[2],
             job_type=row[3],
             status=row[4],
-            config=json.loads(row[5]) if row[5] else {},
-            results=json.loads(row[6]) if row[6] else [],
+            config=_json_loads(row[5]) if row[5] else {},
+            results=_json_loads(row[6]) if row[6] else [],
             aggregation_output=row[7],
             message_ts=row[8],
             created_at=datetime.fromisoformat(row[9]) if row[9] else datetime.now(),
@@ -187,7 +202,7 @@ class QueueItem:
         automation_meta = None
         if raw_automation_meta:
             try:
-                parsed = json.loads(raw_automation_meta)
+                parsed = _json_loads(raw_automation_meta)
             except (TypeError, json.JSONDecodeError):
                 parsed = None
             if isinstance(parsed, dict):
@@ -272,7 +287,7 @@ class WorkspaceLease:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadedFile:
     """File uploaded from Slack and stored locally."""
 
@@ -301,7 +316,7 @@ class UploadedFile:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GitCheckpoint:
     """Git checkpoint for version control."""
 
@@ -330,7 +345,7 @@ class GitCheckpoint:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationSettings:
     """Per-channel notification settings."""
 
@@ -376,7 +391,7 @@ class QueueControl:
         usage_limit_state: dict[str, object] = {}
         if len(row) > 7 and row[7]:
             try:
-                parsed_usage_state = json.loads(row[7])
+                parsed_usage_state = _json_loads(row[7])
             except (TypeError, json.JSONDecodeError):
                 parsed_usage_state = None
             if isinstance(parsed_usage_state, dict):
@@ -628,7 +643,7 @@ class TraceEvent:
         payload: dict[str, Any] = {}
         if raw_payload:
             try:
-                parsed = json.loads(raw_payload)
+                parsed = _json_loads(raw_payload)
             except (TypeError, json.JSONDecodeError):
                 parsed = {}
             if isinstance(parsed, dict):
@@ -662,7 +677,7 @@ class TraceQueueSummary:
         payload: dict[str, Any] = {}
         if raw_payload:
             try:
-                parsed = json.loads(raw_payload)
+                parsed = _json_loads(raw_payload)
             except (TypeError, json.JSONDecodeError):
                 parsed = {}
             if isinstance(parsed, dict):
@@ -920,15 +920,16 @@ def register_actions(app: AsyncApp, deps: HandlerDependencies) -> None:
             return
 
         # Reconstruct ToolActivity from the serialized data
+        # (positional order matches the ToolActivity field order)
         tool = ToolActivity(
-            id=tool_data.get("id", "unknown"),
-            name=tool_data.get("name", "unknown"),
-            input=tool_data.get("input", {}),
-            input_summary=tool_data.get("input_summary", ""),
-            result=tool_data.get("result"),
-            full_result=tool_data.get("full_result"),
-            is_error=tool_data.get("is_error", False),
-            duration_ms=tool_data.get("duration_ms"),
+            tool_data.get("id", "unknown"),
+            tool_data.get("name", "unknown"),
+            tool_data.get("input", {}),
+            tool_data.get("input_summary", ""),
+            tool_data.get("result"),
+            tool_data.get("full_result"),
+            tool_data.get("is_error", False),
+            tool_data.get("duration_ms"),
         )
 
         # Get formatted blocks
@@ -1035,13 +1036,22 @@ def register_actions(app: AsyncApp, deps: HandlerDependencies) -> None:
             data = json.loads(action_value)
             question_id = data["q"]
             question_index = data["i"]
-            selected_label = data["l"]
+            # Buttons posted before option indexes were encoded carry no "o" key.
+            option_index = data.get("o")
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.error(f"Invalid question action data: {e}")
             return
 
         pending = await QuestionManager.get_pending(question_id)
-        if not pending:
+        options = []
+        if pending and type(question_index) is int and 0 <= question_index < len(pending.questions):
+            options = pending.questions[question_index].options
+        if not pending or not (type(option_index) is int and 0 <= option_index < len(options)):
+            if pending:
+                logger.warning(
+                    f"Question option out of range: question={question_index} "
+                    f"option={option_index!r}"
+                )
             await client.chat_postEphemeral(
                 channel=body["channel"]["id"],
                 user=body["user"]["id"],
@@ -1049,6 +1059,8 @@ def register_actions(app: AsyncApp, deps: HandlerDependencies) -> None:
             )
             return
 
+        selected_label = options[option_index].label
+
         # Set the answer for this question
         await QuestionManager.set_answer(question_id, question_index, [selected_label])
 
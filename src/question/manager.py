@@ -21,6 +21,7 @@ from slack_sdk.web.async_client import AsyncWebClient
 from ..config import config
 from ..database.repository import DatabaseRepository
 from ..utils.pending_manager import PendingManager
+from .slack_ui import build_question_blocks
 
 _RECOMMENDED_OPTION_SUFFIX = re.compile(r"\(\s*recommended\s*\)\s*$", re.IGNORECASE)
 _QUESTION_CUE_RE = re.compile(
@@ -36,12 +37,26 @@ _DEFERRED_ANSWER_TTL = timedelta(hours=24)
 _MAX_DEFERRED_ANSWERS_PER_SCOPE = 20
 
 
+# Slack caps button text and checkbox option descriptions at 75 characters
+_SLACK_OPTION_TEXT_LIMIT = 75
+
+
 @dataclass
 class QuestionOption:
-    """A single option for a question."""
+    """A single option for a question.
+
+    ``slack_label``/``slack_description`` hold the Slack-length-truncated text,
+    computed once so re-rendering a question does not re-slice every option.
+    """
 
     label: str
     description: str = ""
+    slack_label: str = field(init=False, repr=False, compare=False)
+    slack_description: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.slack_label = self.label[:_SLACK_OPTION_TEXT_LIMIT]
+        self.slack_description = self.description[:_SLACK_OPTION_TEXT_LIMIT]
 
 
 @dataclass
@@ -365,8 +380,6 @@ class QuestionManager:
             db: Optional database for notification settings
             context_text: Optional context text from Claude explaining why they're asking
         """
-        from .slack_ui import build_question_blocks
-
         blocks = build_question_blocks(pending, context_text)
         mention_prefix = cls._question_mention_prefix(
             context_text=context_text, questions=pending.questions
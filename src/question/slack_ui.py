@@ -4,13 +4,50 @@ Builds interactive Block Kit elements for displaying questions
 and capturing user responses.
 """
 
-import json
+import functools
 from typing import TYPE_CHECKING
 
+import orjson
+
 from src.utils.formatters.base import text_to_rich_text_blocks
 
 if TYPE_CHECKING:
-    from .manager import PendingQuestion, Question
+    from .manager import PendingQuestion, Question, QuestionOption
+
+
+# Static Block Kit fragments shared across renders. Slack only serializes these,
+# so the same dict instances are referenced rather than rebuilt per message.
+# They must never be mutated in place: a change would leak into every later
+# render. Copy a fragment before customizing it.
+_DIVIDER_BLOCK = {"type": "divider"}
+_QUESTION_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": ":question: Assistant has a question",
+        "emoji": True,
+    },
+}
+_ANSWERED_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": ":heavy_check_mark: Question answered",
+        "emoji": True,
+    },
+}
+_SELECT_ALL_TEXT = {"type": "mrkdwn", "text": "_Select all that apply:_"}
+_OTHER_BUTTON_TEXT = {"type": "plain_text", "text": "Other...", "emoji": True}
+_CONFIRM_BUTTON_TEXT = {"type": "plain_text", "text": "Confirm", "emoji": True}
+_CUSTOM_MODAL_TITLE = {"type": "plain_text", "text": "Custom Answer"}
+_CUSTOM_MODAL_SUBMIT = {"type": "plain_text", "text": "Submit"}
+_CUSTOM_MODAL_CLOSE = {"type": "plain_text", "text": "Cancel"}
+_CUSTOM_ANSWER_PLACEHOLDER = {"type": "plain_text", "text": "Type your answer here..."}
+
+
+def _json_value(payload: dict) -> str:
+    """Encode a Block Kit ``value``/``private_metadata`` payload as a JSON string."""
+    return orjson.dumps(payload).decode()
 
 
 def build_question_blocks(pending: "PendingQuestion", context_text: str = "") -> list[dict]:
@@ -23,41 +60,38 @@ def build_question_blocks(pending: "PendingQuestion", context_text: str = "") ->
     Returns:
         List of Slack Block Kit blocks
     """
-    blocks = []
-
-    # Header
-    blocks.append(
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": ":question: Assistant has a question",
-                "emoji": True,
-            },
-        }
-    )
-
-    blocks.append({"type": "divider"})
+    blocks = [_QUESTION_HEADER_BLOCK, _DIVIDER_BLOCK]
+    # Bound methods hoisted once; the question loop below appends repeatedly.
+    append_block = blocks.append
+    extend_blocks = blocks.extend
+    question_id = pending.question_id
+    last_index = len(pending.questions) - 1
 
     # Add context text if provided (rich_text for full-width display)
     if context_text and context_text.strip():
-        blocks.extend(text_to_rich_text_blocks(context_text.strip()))
-        blocks.append({"type": "divider"})
+        extend_blocks(text_to_rich_text_blocks(context_text.strip()))
+        append_block(_DIVIDER_BLOCK)
+
+    # Nothing to render or confirm without questions
+    if last_index < 0:
+        return blocks
 
     # Build blocks for each question
+    has_multiselect = False
     for i, question in enumerate(pending.questions):
         # Question text (rich_text for full-width display)
         question_text = f"**{question.header}**\n{question.question}"
-        blocks.extend(text_to_rich_text_blocks(question_text))
+        extend_blocks(text_to_rich_text_blocks(question_text))
 
         # Build action buttons for options
         if question.multi_select:
             # For multi-select, use checkboxes (returns list of blocks)
-            checkbox_blocks = _build_checkbox_block(pending.question_id, i, question)
-            blocks.extend(checkbox_blocks)
+            has_multiselect = True
+            checkbox_blocks = _build_checkbox_block(question_id, i, question)
+            extend_blocks(checkbox_blocks)
         else:
             # For single-select, use button blocks (includes "Other" button).
-            blocks.extend(_build_button_blocks(pending.question_id, i, question))
+            extend_blocks(_build_button_blocks(question_id, i, question))
 
         # Add option descriptions if any (rich_text for full-width display)
         descriptions = []
@@ -67,33 +101,28 @@ def build_question_blocks(pending: "PendingQuestion", context_text: str = "") ->
 
         if descriptions:
             descriptions_text = "\n".join(descriptions)
-            blocks.extend(text_to_rich_text_blocks(descriptions_text))
+            extend_blocks(text_to_rich_text_blocks(descriptions_text))
 
         # Add spacing between questions
-        if i < len(pending.questions) - 1:
-            blocks.append({"type": "divider"})
+        if i < last_index:
+            append_block(_DIVIDER_BLOCK)
 
     # Always add a single confirm button at the bottom.
     # For single-question single-select, individual button clicks auto-resolve
     # (no confirm needed). For multi-question or multi-select, users must click
     # confirm after making all selections.
-    needs_confirm = len(pending.questions) > 1 or any(q.multi_select for q in pending.questions)
-    if needs_confirm:
-        blocks.append(
+    if last_index > 0 or has_multiselect:
+        append_block(
             {
                 "type": "actions",
-                "block_id": f"question_submit_{pending.question_id}",
+                "block_id": f"question_submit_{question_id}",
                 "elements": [
                     {
                         "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "Confirm",
-                            "emoji": True,
-                        },
+                        "text": _CONFIRM_BUTTON_TEXT,
                         "style": "primary",
                         "action_id": "question_confirm_submit",
-                        "value": pending.question_id,
+                        "value": question_id,
                     }
                 ],
             }
@@ -102,6 +131,24 @@ def build_question_blocks(pending: "PendingQuestion", context_text: str = "") ->
     return blocks
 
 
+def _build_other_button(question_id: str, question_index: int) -> dict:
+    """Build the "Other..." button that opens the custom answer modal.
+
+    Args:
+        question_id: The question ID
+        question_index: Index of this question
+
+    Returns:
+        Slack button element
+    """
+    return {
+        "type": "button",
+        "text": _OTHER_BUTTON_TEXT,
+        "action_id": f"question_custom_{question_index}",
+        "value": _json_value({"q": question_id, "i": question_index}),
+    }
+
+
 def _build_button_blocks(
     question_id: str,
     question_index: int,
@@ -117,57 +164,64 @@ def _build_button_blocks(
     Returns:
         List of Slack actions blocks with buttons
     """
-    buttons = []
-    for opt in question.options:
-        # Value encodes question_id, question_index, and selected label
-        value = json.dumps(
-            {
-                "q": question_id,
-                "i": question_index,
-                "l": opt.label,
-            }
-        )
+    select_action_prefix = f"question_select_{question_index}_"
+    block_id_prefix = f"question_actions_{question_id}_{question_index}_"
 
-        buttons.append(
-            {
-                "type": "button",
-                "text": {
-                    "type": "plain_text",
-                    "text": opt.label[:75],  # Slack button text limit
-                    "emoji": True,
-                },
-                "action_id": f"question_select_{question_index}_{len(buttons)}",
-                "value": value,
-            }
-        )
-
-    # Add "Other" button for custom answer.
-    other_value = json.dumps({"q": question_id, "i": question_index})
-    buttons.append(
+    # Value encodes question_id, question_index, and the option index; the
+    # handler resolves the label from the pending question so the payload size
+    # does not grow with label length (Slack caps values at 2000 chars).
+    buttons = [
         {
             "type": "button",
             "text": {
                 "type": "plain_text",
-                "text": "Other...",
+                "text": opt.slack_label,
                 "emoji": True,
             },
-            "action_id": f"question_custom_{question_index}",
-            "value": other_value,
+            "action_id": select_action_prefix + str(j),
+            "value": _json_value({"q": question_id, "i": question_index, "o": j}),
         }
-    )
+        for j, opt in enumerate(question.options)
+    ]
+
+    # Add "Other" button for custom answer.
+    buttons.append(_build_other_button(question_id, question_index))
 
     # Slack limit: 5 elements per actions block.
-    button_blocks: list[dict] = []
     max_buttons_per_block = 5
-    for idx in range(0, len(buttons), max_buttons_per_block):
-        button_blocks.append(
-            {
-                "type": "actions",
-                "block_id": f"question_actions_{question_id}_{question_index}_{idx // 5}",
-                "elements": buttons[idx : idx + max_buttons_per_block],
-            }
-        )
-    return button_blocks
+    return [
+        {
+            "type": "actions",
+            "block_id": block_id_prefix + str(idx // max_buttons_per_block),
+            "elements": buttons[idx : idx + max_buttons_per_block],
+        }
+        for idx in range(0, len(buttons), max_buttons_per_block)
+    ]
+
+
+def _build_checkbox_option(opt: "QuestionOption") -> dict:
+    """Build a single checkbox option for a multi-select question.
+
+    Args:
+        opt: The question option
+
+    Returns:
+        Slack checkbox option object
+    """
+    option = {
+        "text": {
+            "type": "mrkdwn",
+            "text": f"*{opt.label}*",
+        },
+        "value": opt.label,
+    }
+    # Only add description if it's a non-empty string
+    if opt.description:
+        option["description"] = {
+            "type": "mrkdwn",
+            "text": opt.slack_description,
+        }
+    return option
 
 
 def _build_checkbox_block(
@@ -185,58 +239,29 @@ def _build_checkbox_block(
     Returns:
         List of Slack blocks: section with checkboxes, plus "Other" button
     """
-    options = []
-    max_options = 10
-    for opt in question.options:
-        option_dict = {
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*{opt.label}*",
-            },
-            "value": opt.label,
-        }
-        # Only add description if it's a non-empty string
-        if opt.description:
-            option_dict["description"] = {
-                "type": "mrkdwn",
-                "text": opt.description[:75],
-            }
-        options.append(option_dict)
+    max_options = 10  # Slack limit: 10 options
+    options = [_build_checkbox_option(opt) for opt in question.options[:max_options]]
 
     blocks = [
         {
             "type": "section",
             "block_id": f"question_checkbox_{question_id}_{question_index}",
-            "text": {
-                "type": "mrkdwn",
-                "text": "_Select all that apply:_",
-            },
+            "text": _SELECT_ALL_TEXT,
             "accessory": {
                 "type": "checkboxes",
                 "action_id": f"question_multiselect_{question_index}",
-                "options": options[:max_options],  # Slack limit: 10 options
+                "options": options,
             },
         },
         # Add "Other" button for custom answer
         {
             "type": "actions",
             "block_id": f"question_other_{question_id}_{question_index}",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "Other...",
-                        "emoji": True,
-                    },
-                    "action_id": f"question_custom_{question_index}",
-                    "value": json.dumps({"q": question_id, "i": question_index}),
-                }
-            ],
+            "elements": [_build_other_button(question_id, question_index)],
         },
     ]
 
-    hidden_option_count = len(options) - max_options
+    hidden_option_count = len(question.options) - max_options
     if hidden_option_count > 0:
         blocks.append(
             {
@@ -270,31 +295,17 @@ def build_question_result_blocks(
     Returns:
         List of Slack Block Kit blocks
     """
-    blocks = []
-
-    # Header showing answered
-    blocks.append(
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": ":heavy_check_mark: Question answered",
-                "emoji": True,
-            },
-        }
+    # Show each question and answer (rich_text for full-width display). All
+    # answers are rendered in one pass; paragraphs keep them visually separate.
+    result_text = "\n\n".join(
+        f"**{question.header}**\n*{question.question}*\n\n"
+        f"**Answer:** {', '.join(pending.answers.get(i, ['(no answer)']))}"
+        for i, question in enumerate(pending.questions)
     )
+    if not result_text:
+        return [_ANSWERED_HEADER_BLOCK, _DIVIDER_BLOCK]
 
-    blocks.append({"type": "divider"})
-
-    # Show each question and answer (rich_text for full-width display)
-    for i, question in enumerate(pending.questions):
-        selected = pending.answers.get(i, ["(no answer)"])
-        answer_text = ", ".join(selected)
-
-        result_text = f"**{question.header}**\n*{question.question}*\n\n**Answer:** {answer_text}"
-        blocks.extend(text_to_rich_text_blocks(result_text))
-
-    return blocks
+    return [_ANSWERED_HEADER_BLOCK, _DIVIDER_BLOCK, *text_to_rich_text_blocks(result_text)]
 
 
 def build_custom_answer_modal(
@@ -313,41 +324,45 @@ def build_custom_answer_modal(
         Slack modal view
     """
     # Store both question_id and question_index in private_metadata
-    private_metadata = json.dumps({"q": question_id, "i": question_index})
+    private_metadata = _json_value({"q": question_id, "i": question_index})
 
     return {
         "type": "modal",
         "callback_id": "question_custom_submit",
         "private_metadata": private_metadata,
-        "title": {
-            "type": "plain_text",
-            "text": "Custom Answer",
-        },
-        "submit": {
-            "type": "plain_text",
-            "text": "Submit",
-        },
-        "close": {
-            "type": "plain_text",
-            "text": "Cancel",
-        },
-        "blocks": [
-            {
-                "type": "input",
-                "block_id": "custom_answer_block",
-                "element": {
-                    "type": "plain_text_input",
-                    "action_id": "custom_answer_input",
-                    "multiline": True,
-                    "placeholder": {
-                        "type": "plain_text",
-                        "text": "Type your answer here...",
-                    },
-                },
-                "label": {
-                    "type": "plain_text",
-                    "text": question_header[:24],  # Slack label limit
-                },
-            },
-        ],
+        "title": _CUSTOM_MODAL_TITLE,
+        "submit": _CUSTOM_MODAL_SUBMIT,
+        "close": _CUSTOM_MODAL_CLOSE,
+        "blocks": list(_custom_answer_input_blocks(question_header[:24])),  # Slack label limit
     }
+
+
+@functools.lru_cache(maxsize=128)
+def _custom_answer_input_blocks(label: str) -> tuple[dict, ...]:
+    """Build (and cache per label) the input blocks of the custom answer modal.
+
+    The cached blocks are shared by every modal with this label, so they are
+    returned as a tuple and must never be mutated in place.
+
+    Args:
+        label: Already-truncated input label
+
+    Returns:
+        Tuple containing the single plain-text input block
+    """
+    return (
+        {
+            "type": "input",
+            "block_id": "custom_answer_block",
+            "element": {
+                "type": "plain_text_input",
+                "action_id": "custom_answer_input",
+                "multiline": True,
+                "placeholder": _CUSTOM_ANSWER_PLACEHOLDER,
+            },
+            "label": {
+                "type": "plain_text",
+                "text": label,
+            },
+        },
+    )
@@ -5,18 +5,18 @@ in a modal when the user clicks "Show Details" button.
 """
 
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedDetail:
     """A cached detailed output entry."""
 
     command_id: int
     content: str
-    created_at: float
+    created_at: float  # time.monotonic() timestamp, only meaningful for TTL checks
 
 
 class DetailCache:
@@ -25,9 +25,16 @@ class DetailCache:
     - Automatically expires entries after max_age_seconds
     - Limits total entries to max_entries (LRU eviction)
     - Cleans up on every access to prevent unbounded growth
+
+    ``_cache`` is kept in LRU order, so expiry is tracked separately in
+    ``_expiry_queue`` as ``(created_at, command_id)`` pairs in store order.
+    With a uniform TTL and a monotonic clock that order is also expiry order
+    (wall-clock jumps cannot reorder it), so cleanup only has to pop expired
+    pairs from the left instead of scanning every entry.
     """
 
     _cache: OrderedDict[int, CachedDetail] = OrderedDict()
+    _expiry_queue: deque[tuple[float, int]] = deque()
     _max_age_seconds: int = 28800  # 8 hour default
     _max_entries: int = 1000  # Maximum cached entries
 
@@ -42,14 +49,14 @@ class DetailCache:
         content : str
             The detailed output content.
         """
+        cache = cls._cache
+
         # Remove existing entry first (to update LRU order)
-        cls._cache.pop(command_id, None)
+        cache.pop(command_id, None)
 
-        cls._cache[command_id] = CachedDetail(
-            command_id=command_id,
-            content=content,
-            created_at=time.time(),
-        )
+        created_at = time.monotonic()
+        cache[command_id] = CachedDetail(command_id, content, created_at)
+        cls._expiry_queue.append((created_at, command_id))
 
         # Clean up expired and enforce max size
         cls._cleanup()
@@ -68,38 +75,51 @@ class DetailCache:
         str or None
             The detailed output if found and not expired, None otherwise.
         """
-        entry = cls._cache.get(command_id)
+        cache = cls._cache
+        entry = cache.get(command_id)
         if not entry:
             return None
 
         # Check if expired
-        if time.time() - entry.created_at > cls._max_age_seconds:
-            cls._cache.pop(command_id, None)
+        if time.monotonic() - entry.created_at > cls._max_age_seconds:
+            del cache[command_id]
             return None
 
         # Move to end (most recently accessed)
-        cls._cache.move_to_end(command_id)
+        cache.move_to_end(command_id)
         return entry.content
 
     @classmethod
     def _cleanup(cls) -> None:
         """Remove expired entries and enforce max size."""
-        now = time.time()
-
-        # Remove expired entries
-        expired = [
-            cmd_id
-            for cmd_id, entry in cls._cache.items()
-            if now - entry.created_at > cls._max_age_seconds
-        ]
-        for cmd_id in expired:
-            cls._cache.pop(cmd_id, None)
+        cutoff = time.monotonic() - cls._max_age_seconds
+
+        # Remove expired entries, oldest first. A queued pair is stale when the
+        # command was re-stored (newer created_at) or already evicted.
+        cache = cls._cache
+        cache_get = cache.get
+        queue = cls._expiry_queue
+        popleft = queue.popleft
+        while queue and queue[0][0] < cutoff:
+            created_at, cmd_id = popleft()
+            entry = cache_get(cmd_id)
+            if entry is not None and entry.created_at == created_at:
+                del cache[cmd_id]
 
         # Enforce max size by removing oldest entries (LRU)
-        while len(cls._cache) > cls._max_entries:
-            cls._cache.popitem(last=False)  # Remove oldest (first) entry
+        max_entries = cls._max_entries
+        while len(cache) > max_entries:
+            cache.popitem(last=False)  # Remove oldest (first) entry
+
+        # Re-stores and LRU evictions leave stale pairs behind; rebuild the
+        # queue from live entries before it outgrows the cache.
+        if len(queue) > 2 * max_entries:
+            cls._expiry_queue = deque(
+                sorted((entry.created_at, cmd_id) for cmd_id, entry in cache.items())
+            )
 
     @classmethod
     def clear(cls) -> None:
         """Clear all cached entries."""
         cls._cache.clear()
+        cls._expiry_queue.clear()
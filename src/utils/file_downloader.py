@@ -2,14 +2,27 @@
 
 import asyncio
 import os
+import unicodedata
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import aiofiles
 import aiohttp
 from loguru import logger
 from slack_sdk.web.async_client import AsyncWebClient
 
+# Read size for streamed downloads; large enough to keep per-chunk await/write
+# overhead low without holding much of an upload in memory at once.
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+_SNIPPET_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=300, connect=30)
+
+# Shared HTTP session so connections to files.slack.com stay warm across
+# uploads. Bound to the event loop that created it.
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+_HTTP_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
 
 class FileTooLargeError(Exception):
     """Raised when file exceeds size limit."""
@@ -29,6 +42,32 @@ class FileDownloadError(Exception):
     pass
 
 
+async def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared download session, creating it for the running loop."""
+    global _HTTP_SESSION, _HTTP_SESSION_LOOP
+    current_loop = asyncio.get_running_loop()
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed or _HTTP_SESSION_LOOP is not current_loop:
+        stale_session, stale_loop = _HTTP_SESSION, _HTTP_SESSION_LOOP
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        )
+        _HTTP_SESSION_LOOP = current_loop
+        if stale_session is not None and stale_loop is not None and stale_loop.is_closed():
+            # Nothing can run on the old loop any more, so close() only marks the
+            # session and its connector closed; this avoids the unclosed-session warning.
+            await stale_session.close()
+    return _HTTP_SESSION
+
+
+async def close_http_session() -> None:
+    """Close the shared download session (called on app shutdown)."""
+    global _HTTP_SESSION, _HTTP_SESSION_LOOP
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+    _HTTP_SESSION_LOOP = None
+
+
 def is_snippet(file_info: dict[str, Any]) -> bool:
     """Check if a Slack file is a snippet (pasted code/text).
 
@@ -41,6 +80,11 @@ def is_snippet(file_info: dict[str, Any]) -> bool:
     return mode == "snippet" or filetype in ("text", "snippet", "post")
 
 
+def _collision_key(name: str) -> str:
+    """Normalize a file name for collision checks across filesystem conventions."""
+    return unicodedata.normalize("NFC", name).casefold()
+
+
 def _prepare_local_path(
     *,
     destination_dir: str,
@@ -57,16 +101,22 @@ def _prepare_local_path(
     if default_suffix and not Path(safe_filename).suffix:
         safe_filename += default_suffix
 
-    base_path = Path(destination_dir) / safe_filename
-    local_path = base_path
+    # List the directory once and probe candidate names in memory rather than
+    # issuing a stat() per collision. Names are compared case- and
+    # normalization-insensitively so case-insensitive filesystems (macOS,
+    # Windows) still see "Report.txt" as colliding with "report.txt".
+    existing_names = {_collision_key(name) for name in os.listdir(destination_dir)}
+    if _collision_key(safe_filename) not in existing_names:
+        return Path(destination_dir) / safe_filename
+
+    base_path = Path(safe_filename)
+    stem = base_path.stem
+    suffix = base_path.suffix or default_suffix
     counter = 1
-    while local_path.exists():
-        stem = base_path.stem
-        suffix = base_path.suffix or default_suffix
-        local_path = Path(destination_dir) / f"{stem}_{counter}{suffix}"
+    while _collision_key(f"{stem}_{counter}{suffix}") in existing_names:
         counter += 1
 
-    return local_path
+    return Path(destination_dir) / f"{stem}_{counter}{suffix}"
 
 
 async def save_snippet_content(
@@ -111,18 +161,19 @@ async def save_snippet_content(
         url_private = file_info.get("url_private")
         if url_private:
             try:
-                timeout = aiohttp.ClientTimeout(total=30, connect=10)
-                async with aiohttp.ClientSession(timeout=timeout) as http_session:
-                    # For snippets, url_private points to the raw content
-                    # Use token in header but don't include in any error messages
-                    auth_headers = {"Authorization": f"Bearer {client.token}"}
-                    async with http_session.get(url_private, headers=auth_headers) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                        else:
-                            logger.warning(
-                                f"Failed to fetch snippet content via url_private: HTTP {response.status}"
-                            )
+                http_session = await _get_http_session()
+                # For snippets, url_private points to the raw content
+                # Use token in header but don't include in any error messages
+                auth_headers = {"Authorization": f"Bearer {client.token}"}
+                async with http_session.get(
+                    url_private, headers=auth_headers, timeout=_SNIPPET_FETCH_TIMEOUT
+                ) as response:
+                    if response.status == 200:
+                        content = await response.text()
+                    else:
+                        logger.warning(
+                            f"Failed to fetch snippet content via url_private: HTTP {response.status}"
+                        )
             except aiohttp.ClientError as e:
                 logger.warning(f"HTTP error fetching snippet content: {e}")
             except asyncio.TimeoutError:
@@ -163,6 +214,14 @@ async def save_snippet_content(
     return str(local_path), metadata
 
 
+def _content_range_total(content_range: Optional[str]) -> Optional[int]:
+    """Return the complete size from a ``Content-Range: bytes a-b/total`` header."""
+    if not content_range:
+        return None
+    total = content_range.rpartition("/")[2].strip()
+    return int(total) if total.isdigit() else None
+
+
 async def download_slack_file(
     client: AsyncWebClient,
     file_id: str,
@@ -223,25 +282,38 @@ async def download_slack_file(
         )
 
         # Download file using aiohttp with Slack authorization
-        timeout = aiohttp.ClientTimeout(total=300, connect=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            headers = {"Authorization": f"Bearer {slack_bot_token}"}
-            async with session.get(file_url, headers=headers) as response:
-                if response.status != 200:
+        session = await _get_http_session()
+        headers = {
+            "Authorization": f"Bearer {slack_bot_token}",
+            # Ask for at most one byte past the limit so the server stops sending
+            # oversized bodies (e.g. when Slack reports no size) while we can
+            # still detect that the limit was exceeded.
+            "Range": f"bytes=0-{max_size_bytes}",
+        }
+        async with session.get(file_url, headers=headers, timeout=_DOWNLOAD_TIMEOUT) as response:
+            # A 206 carries only the requested slice, so the real size comes from the
+            # Content-Range total rather than Content-Length. bytes=0-N is
+            # unsatisfiable (416) only for an empty file, which has no body to stream.
+            if response.status == 206:
+                total_size = _content_range_total(response.headers.get("Content-Range"))
+            elif response.status == 416:
+                total_size = _content_range_total(response.headers.get("Content-Range"))
+                if total_size:
                     raise FileDownloadError(f"Failed to download file: HTTP {response.status}")
-
-                # Verify content length if available
+            elif response.status == 200:
                 content_length = response.headers.get("Content-Length")
-                if content_length and int(content_length) > max_size_bytes:
-                    raise FileTooLargeError(local_path.name, int(content_length), max_size_bytes)
-
-                # Write file asynchronously with size verification
-                bytes_downloaded = 0
-                async with aiofiles.open(local_path, "wb") as f:
-                    while True:
-                        chunk = await response.content.read(8192)
-                        if not chunk:
-                            break
+                total_size = int(content_length) if content_length else None
+            else:
+                raise FileDownloadError(f"Failed to download file: HTTP {response.status}")
+
+            if total_size is not None and total_size > max_size_bytes:
+                raise FileTooLargeError(local_path.name, total_size, max_size_bytes)
+
+            # Write file asynchronously with size verification
+            bytes_downloaded = 0
+            async with aiofiles.open(local_path, "wb") as f:
+                if response.status != 416:
+                    async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
                         bytes_downloaded += len(chunk)
                         if bytes_downloaded > max_size_bytes:
                             # Clean up partial file
@@ -16,9 +16,13 @@ def concat_with_spacing(existing: str, new: str) -> str:
     return existing + "\n\n" + new
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseToolActivity:
-    """Structured representation of a tool invocation."""
+    """Structured representation of a tool invocation.
+
+    Slotted because activities are created per streamed tool call and rebuilt on
+    every "view details" click; subclasses must declare ``__slots__ = ()``.
+    """
 
     SUMMARY_RULES: ClassVar[dict[str, dict]] = {}
 
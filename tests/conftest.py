@@ -1,6 +1,5 @@
 """Pytest fixtures for code-sigmas tests."""
 
-import asyncio
 import os
 from pathlib import Path
 
@@ -77,14 +76,6 @@ def clean_hook_registry():
     HookRegistry.clear()
 
 
-@pytest.fixture
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def slack_bot_token() -> str:
     """Get Slack bot token from environment."""
@@ -170,3 +170,81 @@ async def test_effort_menu_selection_handler_updates_model_effort() -> None:
 
     mock_set_model.assert_awaited_once()
     assert mock_set_model.await_args.kwargs["model_value"] == "gpt-5.4-high"
+
+
+@pytest.mark.asyncio
+async def test_question_select_resolves_label_from_option_index() -> None:
+    app = _FakeApp()
+    register_actions(app, SimpleNamespace(db=SimpleNamespace()))
+    handler = next(func for key, func in app.actions.items() if "question_select_" in key)
+    pending = SimpleNamespace(
+        questions=[
+            SimpleNamespace(
+                options=[SimpleNamespace(label="First"), SimpleNamespace(label="Second")]
+            ),
+            SimpleNamespace(options=[]),
+        ],
+        answers={0: ["Second"]},
+    )
+
+    with (
+        patch(
+            "src.handlers.actions.QuestionManager.get_pending",
+            new=AsyncMock(return_value=pending),
+        ),
+        patch("src.handlers.actions.QuestionManager.set_answer", new=AsyncMock()) as set_answer,
+    ):
+        await handler(
+            ack=AsyncMock(),
+            action={"value": '{"q":"q1","i":0,"o":1}'},
+            body=_approval_body(),
+            client=SimpleNamespace(chat_postEphemeral=AsyncMock()),
+            logger=MagicMock(),
+        )
+
+    set_answer.assert_awaited_once_with("q1", 0, ["Second"])
+
+
+@pytest.mark.parametrize(
+    "action_value",
+    [
+        '{"q":"q1","i":0,"o":-1}',
+        '{"q":"q1","i":0,"o":true}',
+        '{"q":"q1","i":0,"l":"First"}',
+    ],
+)
+@pytest.mark.asyncio
+async def test_question_select_rejects_invalid_or_missing_option_index(action_value) -> None:
+    app = _FakeApp()
+    register_actions(app, SimpleNamespace(db=SimpleNamespace()))
+    handler = next(func for key, func in app.actions.items() if "question_select_" in key)
+    pending = SimpleNamespace(
+        questions=[
+            SimpleNamespace(
+                options=[SimpleNamespace(label="First"), SimpleNamespace(label="Second")]
+            ),
+        ],
+        answers={},
+    )
+    client = SimpleNamespace(chat_postEphemeral=AsyncMock())
+
+    with (
+        patch(
+            "src.handlers.actions.QuestionManager.get_pending",
+            new=AsyncMock(return_value=pending),
+        ),
+        patch("src.handlers.actions.QuestionManager.set_answer", new=AsyncMock()) as set_answer,
+    ):
+        await handler(
+            ack=AsyncMock(),
+            action={"value": action_value},
+            body=_approval_body(),
+            client=client,
+            logger=MagicMock(),
+        )
+
+    set_answer.assert_not_awaited()
+    client.chat_postEphemeral.assert_awaited_once()
+    assert "already been answered or timed out" in (
+        client.chat_postEphemeral.await_args.kwargs["text"]
+    )
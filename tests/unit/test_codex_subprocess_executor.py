@@ -11,31 +11,43 @@ from src.codex.subprocess_executor import (
     SubprocessExecutor,
     TurnControlResult,
     _ActiveTurnState,
+    _load_default_instructions,
 )
 from src.config import config
 from src.utils.execution_scope import build_session_scope
 from src.utils.process_utils import terminate_process_safely
 
+_APP_SERVER_COMMAND = ("codex", "app-server", "--listen", "stdio://")
+_NEW_THREAD_METHODS = ("initialize", "thread/start", "turn/start")
+_RESUME_FALLBACK_METHODS = ("initialize", "thread/resume", "thread/start", "turn/start")
+_REUSED_CONNECTION_RESUME_METHODS = ("thread/resume", "turn/start")
+
 
 class _DummyStdout:
     """Simple async stdout stream for subprocess mocks."""
 
+    __slots__ = ("_keep_open", "_closed", "_available", "_pending_batches", "_changed")
+
     def __init__(self, lines: list[str], keep_open: bool = False) -> None:
         self._keep_open = keep_open
         self._closed = False
         self._available: asyncio.Queue[bytes] = asyncio.Queue()
         self._pending_batches: list[list[bytes]] = []
+        # Set whenever a batch is released or the stream closes, so readers
+        # sleep until there is something to do instead of spinning the loop.
+        self._changed = asyncio.Event()
         self.add_lines(lines)
 
     async def readline(self) -> bytes:
         while True:
             if not self._available.empty():
-                return await self._available.get()
+                return self._available.get_nowait()
             if not self._pending_batches and not self._keep_open:
                 return b""
             if self._closed:
                 return b""
-            await asyncio.sleep(0)
+            self._changed.clear()
+            await self._changed.wait()
 
     def add_lines(self, lines: list[str]) -> None:
         """Append more stdout lines for persistent-process tests."""
@@ -56,14 +68,18 @@ class _DummyStdout:
             return
         for line in self._pending_batches.pop(0):
             self._available.put_nowait(line)
+        self._changed.set()
 
     def close(self) -> None:
         self._closed = True
+        self._changed.set()
 
 
 class _DummyStderr:
     """Simple async stderr stream for subprocess mocks."""
 
+    __slots__ = ()
+
     async def read(self) -> bytes:
         return b""
 
@@ -71,6 +87,8 @@ class _DummyStderr:
 class _DummyStdin:
     """Capture JSON-RPC writes sent to app-server stdin."""
 
+    __slots__ = ("writes", "_stdout")
+
     def __init__(self, stdout: _DummyStdout) -> None:
         self.writes: list[str] = []
         self._stdout = stdout
@@ -86,6 +104,8 @@ class _DummyStdin:
 class _DummyProcess:
     """Simple subprocess mock compatible with asyncio interfaces."""
 
+    __slots__ = ("stdout", "stdin", "stderr", "returncode", "signals")
+
     def __init__(self, lines: list[str], keep_open: bool = False) -> None:
         self.stdout = _DummyStdout(lines, keep_open=keep_open)
         self.stdin = _DummyStdin(self.stdout)
@@ -164,14 +184,61 @@ def _sent_errors(process: _DummyProcess) -> list[dict]:
     return [msg for msg in _sent_messages(process) if "id" in msg and "error" in msg]
 
 
+@pytest.fixture(autouse=True)
+def codex_config(monkeypatch):
+    """Pin Codex config defaults that would otherwise read the host's instructions file."""
+    monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
+    return config
+
+
+class _SubprocessExecCapture:
+    """Stand-in for ``asyncio.create_subprocess_exec`` that records the latest call.
+
+    Only the most recent ``(args, kwargs)`` and a spawn count are kept, so memory
+    stays bounded however many processes a test starts.
+    """
+
+    __slots__ = ("process", "last_call", "call_count")
+
+    def __init__(self) -> None:
+        self.process: _DummyProcess | None = None
+        self.last_call: tuple[tuple, dict] | None = None
+        self.call_count = 0
+
+    async def __call__(self, *args, **kwargs) -> _DummyProcess | None:
+        self.last_call = (args, kwargs)
+        self.call_count += 1
+        return self.process
+
+
+@pytest.fixture
+def subprocess_exec(monkeypatch) -> _SubprocessExecCapture:
+    """Patch ``asyncio.create_subprocess_exec``; tests set ``process`` to their dummy."""
+    capture = _SubprocessExecCapture()
+    monkeypatch.setattr("asyncio.create_subprocess_exec", capture)
+    return capture
+
+
+@pytest.fixture
+def executor() -> SubprocessExecutor:
+    """Provide a fresh executor per test.
+
+    The executor keeps connection pools, active-turn registries, and metrics, so it
+    cannot be shared across tests. Tests that open pooled connections shut it down
+    themselves; doing so unconditionally would wait out the fake turns other tests
+    register.
+    """
+    return SubprocessExecutor()
+
+
 class TestCodexSubprocessExecutor:
     """Tests for app-server execution behavior."""
 
     @pytest.mark.asyncio
-    async def test_execute_uses_app_server_and_passes_thread_params(self, monkeypatch):
+    async def test_execute_uses_app_server_and_passes_thread_params(
+        self, executor, subprocess_exec
+    ):
         """Executor should start app-server and send thread/start + turn/start with settings."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -193,27 +260,23 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ) as mock_exec:
-            result = await executor.execute(
-                prompt="build feature",
-                working_directory="/tmp/workspace",
-                sandbox_mode="danger-full-access",
-                approval_mode="never",
-                model="gpt-5.3-codex-high",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="build feature",
+            working_directory="/tmp/workspace",
+            sandbox_mode="danger-full-access",
+            approval_mode="never",
+            model="gpt-5.3-codex-high",
+        )
 
-        args = mock_exec.await_args.args
-        assert args[:4] == ("codex", "app-server", "--listen", "stdio://")
+        args, _ = subprocess_exec.last_call
+        assert args[: len(_APP_SERVER_COMMAND)] == _APP_SERVER_COMMAND
         assert result.success is True
         assert result.session_id == "thread-1"
 
         requests = _sent_requests(process)
-        methods = [req["method"] for req in requests]
-        assert methods == ["initialize", "thread/start", "turn/start"]
+        methods = tuple(req["method"] for req in requests)
+        assert methods == _NEW_THREAD_METHODS
 
         thread_start = requests[1]
         assert thread_start["params"]["cwd"] == "/tmp/workspace"
@@ -228,10 +291,18 @@ class TestCodexSubprocessExecutor:
         assert "collaborationMode" not in turn_start["params"]
 
     @pytest.mark.asyncio
-    async def test_execute_plan_mode_sets_turn_collaboration_mode(self, monkeypatch):
-        """Plan mode should use native app-server collaborationMode on turn/start."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
+    @pytest.mark.parametrize(
+        ("permission_mode", "expected_mode"),
+        [
+            ("plan", "plan"),
+            ("bypassPermissions", "default"),
+            ("default", "default"),
+        ],
+    )
+    async def test_execute_sets_turn_collaboration_mode_for_permission_mode(
+        self, executor, subprocess_exec, permission_mode, expected_mode
+    ):
+        """Permission modes should map to native app-server collaborationMode on turn/start."""
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -256,22 +327,18 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="plan this change",
-                working_directory="/tmp/workspace",
-                model="gpt-5.3-codex-high",
-                permission_mode="plan",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="plan this change",
+            working_directory="/tmp/workspace",
+            model="gpt-5.3-codex-high",
+            permission_mode=permission_mode,
+        )
 
         assert result.success is True
         turn_start = _sent_requests(process)[2]
         assert turn_start["params"]["collaborationMode"] == {
-            "mode": "plan",
+            "mode": expected_mode,
             "settings": {
                 "model": "gpt-5.3-codex",
                 "reasoning_effort": "high",
@@ -281,11 +348,9 @@ class TestCodexSubprocessExecutor:
 
     @pytest.mark.asyncio
     async def test_turn_started_notification_registers_active_turn_when_start_result_has_no_id(
-        self, monkeypatch
+        self, executor, subprocess_exec
     ):
         """Active-turn routing should work even if `turn/start` omits the turn ID."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -308,142 +373,34 @@ class TestCodexSubprocessExecutor:
             keep_open=True,
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            session_scope = build_session_scope("C123", "123.456")
-            task = asyncio.create_task(
-                executor.execute(
-                    prompt="continue",
-                    working_directory="/tmp/workspace",
-                    channel_id="C123",
-                    thread_ts="123.456",
-                    session_id=session_scope,
-                    execution_id="exec-1",
-                )
-            )
-            while not await executor.has_active_turn(session_scope):
-                await asyncio.sleep(0)
-
-            active_turn = await executor.get_active_turn(session_scope)
-            assert active_turn is not None
-            assert active_turn["turn_id"] == "turn-123"
-
-            task.cancel()
-            await asyncio.wait_for(task, timeout=1.0)
-            await executor.shutdown()
-
-    @pytest.mark.asyncio
-    async def test_execute_bypass_mode_sets_default_collaboration_mode(self, monkeypatch):
-        """Bypass mode should map to default collaboration mode for app-server."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
-        process = _DummyProcess(
-            [
-                _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
-                _json_line(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": 2,
-                        "result": {
-                            "thread": {"id": "thread-1"},
-                            "model": "gpt-5.3-codex",
-                        },
-                    }
-                ),
-                _json_line({"jsonrpc": "2.0", "id": 3, "result": {}}),
-                _json_line(
-                    {
-                        "jsonrpc": "2.0",
-                        "method": "turn/completed",
-                        "params": {"turn": {"status": "completed"}},
-                    }
-                ),
-            ]
-        )
-
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="implement this plan",
+        subprocess_exec.process = process
+        session_scope = build_session_scope("C123", "123.456")
+        task = asyncio.create_task(
+            executor.execute(
+                prompt="continue",
                 working_directory="/tmp/workspace",
-                model="gpt-5.3-codex-high",
-                permission_mode="bypassPermissions",
+                channel_id="C123",
+                thread_ts="123.456",
+                session_id=session_scope,
+                execution_id="exec-1",
             )
-
-        assert result.success is True
-        turn_start = _sent_requests(process)[2]
-        assert turn_start["params"]["collaborationMode"] == {
-            "mode": "default",
-            "settings": {
-                "model": "gpt-5.3-codex",
-                "reasoning_effort": "high",
-                "developer_instructions": None,
-            },
-        }
-
-    @pytest.mark.asyncio
-    async def test_execute_default_mode_sets_default_collaboration_mode(self, monkeypatch):
-        """Default mode should explicitly set default collaboration mode."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
-        process = _DummyProcess(
-            [
-                _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
-                _json_line(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": 2,
-                        "result": {
-                            "thread": {"id": "thread-1"},
-                            "model": "gpt-5.3-codex",
-                        },
-                    }
-                ),
-                _json_line({"jsonrpc": "2.0", "id": 3, "result": {}}),
-                _json_line(
-                    {
-                        "jsonrpc": "2.0",
-                        "method": "turn/completed",
-                        "params": {"turn": {"status": "completed"}},
-                    }
-                ),
-            ]
         )
+        while not await executor.has_active_turn(session_scope):
+            await asyncio.sleep(0)
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="implement this plan",
-                working_directory="/tmp/workspace",
-                model="gpt-5.3-codex-high",
-                permission_mode="default",
-            )
+        active_turn = await executor.get_active_turn(session_scope)
+        assert active_turn is not None
+        assert active_turn["turn_id"] == "turn-123"
 
-        assert result.success is True
-        turn_start = _sent_requests(process)[2]
-        assert turn_start["params"]["collaborationMode"] == {
-            "mode": "default",
-            "settings": {
-                "model": "gpt-5.3-codex",
-                "reasoning_effort": "high",
-                "developer_instructions": None,
-            },
-        }
+        task.cancel()
+        await asyncio.wait_for(task, timeout=1.0)
+        await executor.shutdown()
 
     @pytest.mark.asyncio
-    async def test_execute_handles_codex_event_prefixed_notifications(self, monkeypatch):
+    async def test_execute_handles_codex_event_prefixed_notifications(
+        self, executor, subprocess_exec
+    ):
         """Prefixed codex/event notifications should be normalized and processed."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -472,24 +429,20 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="stream test",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="stream test",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         assert result.output == "Prefixed stream works."
 
     @pytest.mark.asyncio
-    async def test_error_notification_uses_structured_error_payload(self, monkeypatch):
+    async def test_error_notification_uses_structured_error_payload(
+        self, executor, subprocess_exec
+    ):
         """Structured error notifications should surface the nested message and details."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -520,15 +473,11 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="analyze quant/options",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="analyze quant/options",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is False
         assert "Context window exceeded" in (result.error or "")
@@ -536,10 +485,8 @@ class TestCodexSubprocessExecutor:
         assert "codexErrorInfo=contextWindowExceeded" in (result.error or "")
 
     @pytest.mark.asyncio
-    async def test_error_notification_with_retry_does_not_end_turn(self, monkeypatch):
+    async def test_error_notification_with_retry_does_not_end_turn(self, executor, subprocess_exec):
         """Retryable error notifications should not terminate execution early."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -573,24 +520,20 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="retryable issue",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="retryable issue",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         assert result.error is None
 
     @pytest.mark.asyncio
-    async def test_assistant_deltas_preserve_text_and_skip_completed_duplicate(self, monkeypatch):
+    async def test_assistant_deltas_preserve_text_and_skip_completed_duplicate(
+        self, executor, subprocess_exec
+    ):
         """Delta chunks should be concatenated verbatim and not replayed by item/completed."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -642,25 +585,19 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="format",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="format",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         assert result.output == "I'm testing formatting."
         assert "\n\n" not in result.output
 
     @pytest.mark.asyncio
-    async def test_assistant_completed_repairs_missing_delta_tail(self, monkeypatch):
+    async def test_assistant_completed_repairs_missing_delta_tail(self, executor, subprocess_exec):
         """Completed assistant items should backfill missing delta tail text."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -702,24 +639,20 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="format",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="format",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         assert result.output == "I'm testing formatting."
 
     @pytest.mark.asyncio
-    async def test_agent_message_completed_without_deltas_is_retained(self, monkeypatch):
+    async def test_agent_message_completed_without_deltas_is_retained(
+        self, executor, subprocess_exec
+    ):
         """item/completed assistant text should still be captured when no deltas were emitted."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -754,24 +687,20 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="format",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="format",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         assert result.output == "Final assistant message"
 
     @pytest.mark.asyncio
-    async def test_internal_reasoning_and_diff_deltas_are_not_exposed(self, monkeypatch):
+    async def test_internal_reasoning_and_diff_deltas_are_not_exposed(
+        self, executor, subprocess_exec
+    ):
         """Reasoning and turn diff notifications should not leak into user output."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -827,15 +756,11 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="summarize changes",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="summarize changes",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         assert result.output == "Summary only."
@@ -843,10 +768,8 @@ class TestCodexSubprocessExecutor:
         assert "Capturing line references" not in result.output
 
     @pytest.mark.asyncio
-    async def test_user_input_request_uses_callback_response(self, monkeypatch):
+    async def test_user_input_request_uses_callback_response(self, executor, subprocess_exec):
         """request_user_input server requests should be answered by callback payload."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         question = {
             "id": "q_1",
             "question": "Proceed?",
@@ -889,16 +812,12 @@ class TestCodexSubprocessExecutor:
         callback_payload = {"answers": {"q_1": {"answers": ["Yes"]}}}
         on_user_input_request = AsyncMock(return_value=callback_payload)
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="continue",
-                working_directory="/tmp/workspace",
-                on_user_input_request=on_user_input_request,
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="continue",
+            working_directory="/tmp/workspace",
+            on_user_input_request=on_user_input_request,
+        )
 
         assert result.success is True
         on_user_input_request.assert_awaited_once_with("item_1", {"questions": [question]})
@@ -907,10 +826,8 @@ class TestCodexSubprocessExecutor:
         assert response_by_id[10]["result"] == callback_payload
 
     @pytest.mark.asyncio
-    async def test_user_input_request_accepts_string_request_id(self, monkeypatch):
+    async def test_user_input_request_accepts_string_request_id(self, executor, subprocess_exec):
         """Server request IDs should support JSON-RPC string values."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         question = {
             "id": "q_1",
             "question": "Proceed?",
@@ -953,26 +870,20 @@ class TestCodexSubprocessExecutor:
         callback_payload = {"answers": {"q_1": {"answers": ["Yes"]}}}
         on_user_input_request = AsyncMock(return_value=callback_payload)
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="continue",
-                working_directory="/tmp/workspace",
-                on_user_input_request=on_user_input_request,
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="continue",
+            working_directory="/tmp/workspace",
+            on_user_input_request=on_user_input_request,
+        )
 
         assert result.success is True
         response_by_id = {msg["id"]: msg for msg in _sent_responses(process)}
         assert response_by_id["req-10"]["result"] == callback_payload
 
     @pytest.mark.asyncio
-    async def test_approval_request_uses_callback_response(self, monkeypatch):
+    async def test_approval_request_uses_callback_response(self, executor, subprocess_exec):
         """Approval server requests should use callback-provided decision payload."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         approval_params = {
             "itemId": "item_2",
             "threadId": "thread-1",
@@ -1014,16 +925,12 @@ class TestCodexSubprocessExecutor:
 
         on_approval_request = AsyncMock(return_value={"decision": "decline"})
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="run command",
-                working_directory="/tmp/workspace",
-                on_approval_request=on_approval_request,
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="run command",
+            working_directory="/tmp/workspace",
+            on_approval_request=on_approval_request,
+        )
 
         assert result.success is True
         on_approval_request.assert_awaited_once_with(
@@ -1034,10 +941,8 @@ class TestCodexSubprocessExecutor:
         assert response_by_id[20]["result"] == {"decision": "decline"}
 
     @pytest.mark.asyncio
-    async def test_dynamic_tool_call_returns_structured_failure(self, monkeypatch):
+    async def test_dynamic_tool_call_returns_structured_failure(self, executor, subprocess_exec):
         """Dynamic tool requests should return schema-valid failure payloads."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         params = {
             "threadId": "thread-1",
             "turnId": "turn-1",
@@ -1078,15 +983,11 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="run dynamic tool",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="run dynamic tool",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         response_by_id = {msg["id"]: msg for msg in _sent_responses(process)}
@@ -1095,10 +996,8 @@ class TestCodexSubprocessExecutor:
         assert "not supported" in response_by_id[30]["result"]["contentItems"][0]["text"]
 
     @pytest.mark.asyncio
-    async def test_legacy_approval_request_methods_are_rejected(self, monkeypatch):
+    async def test_legacy_approval_request_methods_are_rejected(self, executor, subprocess_exec):
         """Legacy non-v2 approval request methods should return method-not-found."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -1132,25 +1031,21 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="legacy request",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="legacy request",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         errors_by_id = {msg["id"]: msg for msg in _sent_errors(process)}
         assert errors_by_id[31]["error"]["code"] == -32601
 
     @pytest.mark.asyncio
-    async def test_default_approval_decision_respects_mode_when_no_callback(self, monkeypatch):
+    async def test_default_approval_decision_respects_mode_when_no_callback(
+        self, executor, subprocess_exec
+    ):
         """Without callback, never-mode auto-accepts while on-request declines."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -1185,56 +1080,52 @@ class TestCodexSubprocessExecutor:
             keep_open=True,
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result_never = await executor.execute(
-                prompt="p1",
-                working_directory="/tmp/workspace",
-                approval_mode="never",
-            )
-            process.stdout.add_lines(
+        subprocess_exec.process = process
+        result_never = await executor.execute(
+            prompt="p1",
+            working_directory="/tmp/workspace",
+            approval_mode="never",
+        )
+        process.stdout.add_lines(
+            [
                 [
-                    [
-                        _json_line(
-                            {
-                                "jsonrpc": "2.0",
-                                "id": 4,
-                                "result": {"thread": {"id": "thread-2"}},
-                            }
-                        )
-                    ],
-                    [
-                        _json_line({"jsonrpc": "2.0", "id": 5, "result": {}}),
-                        _json_line(
-                            {
-                                "jsonrpc": "2.0",
-                                "id": 22,
-                                "method": "item/fileChange/requestApproval",
-                                "params": {
-                                    "itemId": "item_4",
-                                    "threadId": "thread-2",
-                                    "turnId": "turn-2",
-                                },
-                            }
-                        ),
-                        _json_line(
-                            {
-                                "jsonrpc": "2.0",
-                                "method": "turn/completed",
-                                "params": {"turn": {"status": "completed"}},
-                            }
-                        ),
-                    ],
-                ]
-            )
-            result_on_request = await executor.execute(
-                prompt="p2",
-                working_directory="/tmp/workspace",
-                approval_mode="on-request",
-            )
+                    _json_line(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": 4,
+                            "result": {"thread": {"id": "thread-2"}},
+                        }
+                    )
+                ],
+                [
+                    _json_line({"jsonrpc": "2.0", "id": 5, "result": {}}),
+                    _json_line(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": 22,
+                            "method": "item/fileChange/requestApproval",
+                            "params": {
+                                "itemId": "item_4",
+                                "threadId": "thread-2",
+                                "turnId": "turn-2",
+                            },
+                        }
+                    ),
+                    _json_line(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "turn/completed",
+                            "params": {"turn": {"status": "completed"}},
+                        }
+                    ),
+                ],
+            ]
+        )
+        result_on_request = await executor.execute(
+            prompt="p2",
+            working_directory="/tmp/workspace",
+            approval_mode="on-request",
+        )
 
         assert result_never.success is True
         assert result_on_request.success is True
@@ -1247,10 +1138,8 @@ class TestCodexSubprocessExecutor:
         await executor.shutdown()
 
     @pytest.mark.asyncio
-    async def test_resume_missing_thread_retries_with_new_thread(self, monkeypatch):
+    async def test_resume_missing_thread_retries_with_new_thread(self, executor, subprocess_exec):
         """Missing resume thread should retry with thread/start."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 [_json_line({"jsonrpc": "2.0", "id": 1, "result": {}})],
@@ -1285,29 +1174,23 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ) as mock_exec:
-            result = await executor.execute(
-                prompt="retry me",
-                working_directory="/tmp/workspace",
-                resume_session_id="old-thread",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="retry me",
+            working_directory="/tmp/workspace",
+            resume_session_id="old-thread",
+        )
 
-        assert mock_exec.await_count == 1
+        assert subprocess_exec.call_count == 1
         assert result.success is True
         assert result.session_id == "thread-2"
 
-        methods = [req["method"] for req in _sent_requests(process)]
-        assert methods == ["initialize", "thread/resume", "thread/start", "turn/start"]
+        methods = tuple(req["method"] for req in _sent_requests(process))
+        assert methods == _RESUME_FALLBACK_METHODS
 
     @pytest.mark.asyncio
-    async def test_resume_missing_rollout_retries_with_new_thread(self, monkeypatch):
+    async def test_resume_missing_rollout_retries_with_new_thread(self, executor, subprocess_exec):
         """Missing rollout on a pooled server should retry with thread/start."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 [_json_line({"jsonrpc": "2.0", "id": 1, "result": {}})],
@@ -1342,26 +1225,24 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ) as mock_exec:
-            result = await executor.execute(
-                prompt="retry me",
-                working_directory="/tmp/workspace",
-                resume_session_id="thread-1",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="retry me",
+            working_directory="/tmp/workspace",
+            resume_session_id="thread-1",
+        )
 
-        assert mock_exec.await_count == 1
+        assert subprocess_exec.call_count == 1
         assert result.success is True
         assert result.session_id == "thread-2"
 
-        methods = [req["method"] for req in _sent_requests(process)]
-        assert methods == ["initialize", "thread/resume", "thread/start", "turn/start"]
+        methods = tuple(req["method"] for req in _sent_requests(process))
+        assert methods == _RESUME_FALLBACK_METHODS
 
     @pytest.mark.asyncio
-    async def test_exec_prepends_default_instructions_when_file_exists(self, monkeypatch, tmp_path):
+    async def test_exec_prepends_default_instructions_when_file_exists(
+        self, executor, subprocess_exec, monkeypatch, tmp_path
+    ):
         """Executor prepends default instructions from file before turn/start input."""
         instructions = tmp_path / "default_instructions.txt"
         instructions.write_text("ALWAYS BE CONCISE", encoding="utf-8")
@@ -1389,25 +1270,33 @@ class TestCodexSubprocessExecutor:
             ]
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            result = await executor.execute(
-                prompt="do a repo review",
-                working_directory="/tmp/workspace",
-            )
+        subprocess_exec.process = process
+        result = await executor.execute(
+            prompt="do a repo review",
+            working_directory="/tmp/workspace",
+        )
 
         assert result.success is True
         turn_start = _sent_requests(process)[2]
         assert turn_start["params"]["input"][0]["text"] == "ALWAYS BE CONCISE\n\ndo a repo review"
 
+    def test_default_instructions_are_cached_until_file_changes(self, tmp_path):
+        """Instruction reads should be cached but refreshed once the file is edited."""
+        instructions = tmp_path / "default_instructions.txt"
+        instructions.write_text("BE BRIEF\n", encoding="utf-8")
+
+        assert _load_default_instructions(instructions) == "BE BRIEF"
+        with patch("src.codex.subprocess_executor.Path.read_text") as mock_read:
+            assert _load_default_instructions(instructions) == "BE BRIEF"
+        mock_read.assert_not_called()
+
+        instructions.write_text("BE THOROUGH\n", encoding="utf-8")
+        assert _load_default_instructions(instructions) == "BE THOROUGH"
+
     @pytest.mark.asyncio
-    async def test_cancel_resolves_channel_prefixed_track_id(self):
+    async def test_cancel_resolves_channel_prefixed_track_id(self, executor):
         """cancel() should find executions by execution_id even with channel-prefixed track ids."""
         process = _DummyProcess([])
-        executor = SubprocessExecutor()
         executor._registry.active_processes["C123_exec-1"] = process
         executor._registry.process_channels["C123_exec-1"] = "C123"
         executor._registry.execution_track_ids["exec-1"] = "C123_exec-1"
@@ -1431,9 +1320,8 @@ class TestCodexSubprocessExecutor:
         assert process.killed is True
 
     @pytest.mark.asyncio
-    async def test_active_turn_lifecycle_helpers(self):
+    async def test_active_turn_lifecycle_helpers(self, executor):
         """Active turn helpers should reflect done_event lifecycle transitions."""
-        executor = SubprocessExecutor()
         state = _ActiveTurnState(
             scope="scope-1",
             track_id="track-1",
@@ -1456,9 +1344,8 @@ class TestCodexSubprocessExecutor:
         assert await executor.get_active_turn("scope-1") is None
 
     @pytest.mark.asyncio
-    async def test_steer_active_turn_success(self):
+    async def test_steer_active_turn_success(self, executor):
         """steer_active_turn should return callback result when control request is consumed."""
-        executor = SubprocessExecutor()
         control_queue: asyncio.Queue = asyncio.Queue()
         state = _ActiveTurnState(
             scope="scope-2",
@@ -1485,9 +1372,8 @@ class TestCodexSubprocessExecutor:
         assert result.turn_id == "turn-2b"
 
     @pytest.mark.asyncio
-    async def test_steer_active_turn_timeout(self):
+    async def test_steer_active_turn_timeout(self, executor):
         """steer_active_turn should time out when no active loop consumes control request."""
-        executor = SubprocessExecutor()
         state = _ActiveTurnState(
             scope="scope-3",
             track_id="track-3",
@@ -1504,9 +1390,8 @@ class TestCodexSubprocessExecutor:
         assert "timed out" in (result.error or "")
 
     @pytest.mark.asyncio
-    async def test_interrupt_active_turn_success(self):
+    async def test_interrupt_active_turn_success(self, executor):
         """interrupt_active_turn should return callback result when consumed."""
-        executor = SubprocessExecutor()
         control_queue: asyncio.Queue = asyncio.Queue()
         state = _ActiveTurnState(
             scope="scope-4",
@@ -1533,39 +1418,33 @@ class TestCodexSubprocessExecutor:
         assert result.turn_id == "turn-4"
 
     @pytest.mark.asyncio
-    async def test_cancel_interrupts_without_terminating_when_turn_settles(self):
+    async def test_cancel_interrupts_without_terminating_when_turn_settles(self, executor):
         """cancel() should preserve the pooled process when the turn settles cleanly."""
         process = _DummyProcess([])
-        executor = SubprocessExecutor()
         executor._registry.active_processes["exec-1"] = process
         executor._registry.process_scopes["exec-1"] = "scope-cancel"
 
-        with patch.object(
-            executor,
-            "interrupt_active_turn",
-            new=AsyncMock(return_value=TurnControlResult(success=True, turn_id="turn-cancel")),
-        ) as mock_interrupt:
-            with patch.object(
-                executor,
-                "_wait_for_turn_settle",
-                new=AsyncMock(return_value=True),
-            ) as mock_settle:
-                with patch(
-                    "src.codex.subprocess_executor.terminate_process_safely",
-                    new=AsyncMock(),
-                ) as mock_terminate:
-                    cancelled = await executor.cancel("exec-1")
+        # The executor is per-test, so its methods can be replaced without restoring.
+        executor.interrupt_active_turn = AsyncMock(
+            return_value=TurnControlResult(success=True, turn_id="turn-cancel")
+        )
+        executor._wait_for_turn_settle = AsyncMock(return_value=True)
+        with patch(
+            "src.codex.subprocess_executor.terminate_process_safely",
+            new=AsyncMock(),
+        ) as mock_terminate:
+            cancelled = await executor.cancel("exec-1")
 
         assert cancelled is True
-        mock_interrupt.assert_awaited_once_with("scope-cancel", timeout=1.0)
-        mock_settle.assert_awaited_once_with("scope-cancel", timeout=1.5)
+        executor.interrupt_active_turn.assert_awaited_once_with("scope-cancel", timeout=1.0)
+        executor._wait_for_turn_settle.assert_awaited_once_with("scope-cancel", timeout=1.5)
         mock_terminate.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_execute_reuses_session_connection_for_same_scope(self, monkeypatch):
+    async def test_execute_reuses_session_connection_for_same_scope(
+        self, executor, subprocess_exec
+    ):
         """Repeated turns in the same scope should reuse one app-server process."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -1588,67 +1467,57 @@ class TestCodexSubprocessExecutor:
             keep_open=True,
         )
 
-        executor = SubprocessExecutor()
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ) as mock_exec:
-            first = await executor.execute(
-                prompt="first",
-                working_directory="/tmp/workspace",
-                channel_id="C123",
-                thread_ts="123.456",
-            )
-            process.stdout.add_lines(
+        subprocess_exec.process = process
+        first = await executor.execute(
+            prompt="first",
+            working_directory="/tmp/workspace",
+            channel_id="C123",
+            thread_ts="123.456",
+        )
+        process.stdout.add_lines(
+            [
                 [
-                    [
-                        _json_line(
-                            {
-                                "jsonrpc": "2.0",
-                                "id": 4,
-                                "result": {"thread": {"id": "thread-1"}},
-                            }
-                        )
-                    ],
-                    [
-                        _json_line({"jsonrpc": "2.0", "id": 5, "result": {}}),
-                        _json_line(
-                            {
-                                "jsonrpc": "2.0",
-                                "method": "turn/completed",
-                                "params": {"turn": {"status": "completed"}},
-                            }
-                        ),
-                    ],
-                ]
-            )
-            second = await executor.execute(
-                prompt="second",
-                working_directory="/tmp/workspace",
-                channel_id="C123",
-                thread_ts="123.456",
-                resume_session_id=first.session_id,
-            )
+                    _json_line(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": 4,
+                            "result": {"thread": {"id": "thread-1"}},
+                        }
+                    )
+                ],
+                [
+                    _json_line({"jsonrpc": "2.0", "id": 5, "result": {}}),
+                    _json_line(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "turn/completed",
+                            "params": {"turn": {"status": "completed"}},
+                        }
+                    ),
+                ],
+            ]
+        )
+        second = await executor.execute(
+            prompt="second",
+            working_directory="/tmp/workspace",
+            channel_id="C123",
+            thread_ts="123.456",
+            resume_session_id=first.session_id,
+        )
 
         assert first.success is True
         assert second.success is True
-        assert mock_exec.await_count == 1
-
-        methods = [req["method"] for req in _sent_requests(process)]
-        assert methods == [
-            "initialize",
-            "thread/start",
-            "turn/start",
-            "thread/resume",
-            "turn/start",
-        ]
+        assert subprocess_exec.call_count == 1
+
+        methods = tuple(req["method"] for req in _sent_requests(process))
+        assert methods == _NEW_THREAD_METHODS + _REUSED_CONNECTION_RESUME_METHODS
         await executor.shutdown()
 
     @pytest.mark.asyncio
-    async def test_dual_ready_rpc_and_control_does_not_timeout_control(self, monkeypatch):
+    async def test_dual_ready_rpc_and_control_does_not_timeout_control(
+        self, executor, subprocess_exec
+    ):
         """When rpc/control complete together, control should not be dropped and time out."""
-        monkeypatch.setattr(config, "CODEX_PREPEND_DEFAULT_INSTRUCTIONS", False)
-
         process = _DummyProcess(
             [
                 _json_line({"jsonrpc": "2.0", "id": 1, "result": {}}),
@@ -1669,7 +1538,6 @@ class TestCodexSubprocessExecutor:
                 ),
             ]
         )
-        executor = SubprocessExecutor()
         real_wait = asyncio.wait
 
         async def wait_both(tasks, return_when=asyncio.FIRST_COMPLETED):
@@ -1685,29 +1553,23 @@ class TestCodexSubprocessExecutor:
                 return done, pending
             return await real_wait(tasks, return_when=return_when)
 
-        with patch(
-            "asyncio.create_subprocess_exec",
-            new=AsyncMock(return_value=process),
-        ):
-            with patch("src.codex.subprocess_executor.asyncio.wait", new=wait_both):
-                exec_task = asyncio.create_task(
-                    executor.execute(prompt="run", working_directory="/tmp/workspace")
-                )
-                while not await executor.has_active_turn(":channel"):
-                    await asyncio.sleep(0)
-                steer_result = await executor.steer_active_turn(
-                    ":channel", "follow-up", timeout=0.5
-                )
-                result = await exec_task
+        subprocess_exec.process = process
+        with patch("src.codex.subprocess_executor.asyncio.wait", new=wait_both):
+            exec_task = asyncio.create_task(
+                executor.execute(prompt="run", working_directory="/tmp/workspace")
+            )
+            while not await executor.has_active_turn(":channel"):
+                await asyncio.sleep(0)
+            steer_result = await executor.steer_active_turn(":channel", "follow-up", timeout=0.5)
+            result = await exec_task
 
         assert result.success is True
         assert steer_result.success is False
         assert steer_result.error != "steer request timed out"
 
     @pytest.mark.asyncio
-    async def test_metrics_snapshot_and_reset(self):
+    async def test_metrics_snapshot_and_reset(self, executor):
         """Executor should expose and reset integration metrics."""
-        executor = SubprocessExecutor()
         await executor._increment_metric("steer_requests", 2)
         await executor._increment_metric("steer_successes", 1)
         await executor.record_queue_fallback(success=True)
@@ -17,6 +17,47 @@ from src.handlers.command_router import (
 from src.utils.mode_directives import PlanModeDirective
 
 
+def _codex_session(**overrides) -> Session:
+    """Build a Codex session with the defaults shared by most routing tests."""
+    return Session(
+        **{
+            "model": "gpt-5.3-codex",
+            "working_directory": "/tmp",
+            "codex_session_id": "codex-old",
+            "sandbox_mode": "workspace-write",
+            "approval_mode": "on-request",
+            **overrides,
+        }
+    )
+
+
+def _claude_session(**overrides) -> Session:
+    """Build a Claude session with the defaults shared by most routing tests."""
+    return Session(
+        **{
+            "model": "opus",
+            "working_directory": "/tmp",
+            "claude_session_id": "claude-old",
+            **overrides,
+        }
+    )
+
+
+@pytest.fixture
+def deps() -> SimpleNamespace:
+    """Build router dependencies with async mocks for every DB/executor call used."""
+    return SimpleNamespace(
+        db=SimpleNamespace(
+            update_session_claude_id=AsyncMock(),
+            update_session_codex_id=AsyncMock(),
+            update_session_mode=AsyncMock(),
+            get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
+        ),
+        executor=SimpleNamespace(execute=AsyncMock()),
+        codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
+    )
+
+
 class TestCommandRouter:
     """Tests for route selection and execution."""
 
@@ -41,25 +82,11 @@ class TestCommandRouter:
         assert resolve_backend_for_session(Session(model="gpt-5.3-codex")) == "codex"
 
     @pytest.mark.asyncio
-    async def test_execute_for_session_claude(self):
+    async def test_execute_for_session_claude(self, deps):
         """Claude sessions call Claude executor and persist Claude session ID."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
         deps.executor.execute.return_value = SimpleNamespace(session_id="claude-new", success=True)
 
-        session = Session(
-            id=7,
-            model="opus",
-            working_directory="/tmp",
-            claude_session_id="claude-old",
-        )
+        session = _claude_session(id=7)
 
         routed = await execute_for_session(
             deps=deps,
@@ -77,31 +104,15 @@ class TestCommandRouter:
         deps.db.update_session_codex_id.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_execute_for_session_codex(self):
+    async def test_execute_for_session_codex(self, deps):
         """Codex sessions call Codex executor and persist Codex session ID."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
         deps.codex_executor.execute.return_value = SimpleNamespace(
             session_id="codex-new",
             success=True,
             output="",
         )
 
-        session = Session(
-            id=9,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=9)
 
         routed = await execute_for_session(
             deps=deps,
@@ -121,17 +132,10 @@ class TestCommandRouter:
     @pytest.mark.asyncio
     async def test_execute_for_session_uses_prepared_auto_worktree_and_skips_persistence(
         self,
+        deps,
     ):
         """Auto-worktree executions should run in the leased cwd without persisting IDs."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                get_active_workspace_lease_by_root=AsyncMock(return_value=None),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
+        deps.db.get_active_workspace_lease_by_root = AsyncMock(return_value=None)
         deps.executor.execute.return_value = SimpleNamespace(
             session_id="claude-auto",
             success=True,
@@ -139,13 +143,7 @@ class TestCommandRouter:
             detailed_output="",
         )
 
-        session = Session(
-            id=21,
-            channel_id="C123",
-            model="opus",
-            working_directory="/repo",
-            claude_session_id="claude-old",
-        )
+        session = _claude_session(id=21, channel_id="C123", working_directory="/repo")
         prepared = PreparedWorkspace(
             lease=WorkspaceLease(
                 session_id=21,
@@ -217,22 +215,11 @@ class TestCommandRouter:
         )
 
     @pytest.mark.asyncio
-    async def test_execute_for_session_claude_skips_id_persistence_when_disabled(self):
+    async def test_execute_for_session_claude_skips_id_persistence_when_disabled(self, deps):
         """When persist_session_ids=False, Claude session IDs should not be written to DB."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
         deps.executor.execute.return_value = SimpleNamespace(session_id="claude-new", success=True)
 
-        session = Session(
-            id=7, model="opus", working_directory="/tmp", claude_session_id="claude-old"
-        )
+        session = _claude_session(id=7)
 
         routed = await execute_for_session(
             deps=deps,
@@ -248,31 +235,15 @@ class TestCommandRouter:
         deps.db.update_session_claude_id.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_execute_for_session_codex_skips_id_persistence_when_disabled(self):
+    async def test_execute_for_session_codex_skips_id_persistence_when_disabled(self, deps):
         """When persist_session_ids=False, Codex session IDs should not be written to DB."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
         deps.codex_executor.execute.return_value = SimpleNamespace(
             session_id="codex-new",
             success=True,
             output="",
         )
 
-        session = Session(
-            id=9,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=9)
 
         routed = await execute_for_session(
             deps=deps,
@@ -288,16 +259,9 @@ class TestCommandRouter:
         deps.db.update_session_codex_id.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_execute_for_session_codex_without_executor(self):
+    async def test_execute_for_session_codex_without_executor(self, deps):
         """Codex routing fails fast when no Codex executor is configured."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=None,
-        )
+        deps.codex_executor = None
         session = Session(id=1, model="gpt-5.3-codex", working_directory="/tmp")
 
         with pytest.raises(RuntimeError, match="Codex executor is not configured"):
@@ -311,31 +275,15 @@ class TestCommandRouter:
             )
 
     @pytest.mark.asyncio
-    async def test_execute_for_session_codex_plan_mode_passes_permission_mode(self):
+    async def test_execute_for_session_codex_plan_mode_passes_permission_mode(self, deps):
         """Codex plan mode augments prompt format guidance and forwards permission mode."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
         deps.codex_executor.execute.return_value = SimpleNamespace(
             session_id="codex-new",
             success=True,
             output="",
         )
 
-        session = Session(
-            id=11,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            permission_mode="plan",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=11, permission_mode="plan")
 
         await execute_for_session(
             deps=deps,
@@ -352,17 +300,8 @@ class TestCommandRouter:
         assert kwargs["permission_mode"] == "plan"
 
     @pytest.mark.asyncio
-    async def test_codex_plan_mode_splan_uses_adversarial_flow_and_planner_model(self):
+    async def test_codex_plan_mode_splan_uses_adversarial_flow_and_planner_model(self, deps):
         """`splan` should request approval with summary and continue using planner model."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
         deps.codex_executor.execute = AsyncMock(
             side_effect=[
                 SimpleNamespace(session_id="codex-1", success=True, output="initial"),
@@ -394,15 +333,7 @@ class TestCommandRouter:
             ]
         )
 
-        session = Session(
-            id=20,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            permission_mode="plan",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=20, permission_mode="plan")
         plan_directive = PlanModeDirective(
             strategy="splan",
             models=("gpt-5.4-high", "gpt-5.3-codex"),
@@ -434,34 +365,14 @@ class TestCommandRouter:
         assert final_call_kwargs["permission_mode"] == config.DEFAULT_BYPASS_MODE
 
     @pytest.mark.asyncio
-    async def test_codex_plan_mode_splan_rejects_non_codex_planner_model(self):
+    async def test_codex_plan_mode_splan_rejects_non_codex_planner_model(self, deps):
         """`splan` planner must match active backend."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(
-                execute=AsyncMock(
-                    return_value=SimpleNamespace(
-                        session_id="codex-1",
-                        success=True,
-                        output="initial",
-                    )
-                )
-            ),
-        )
-        session = Session(
-            id=21,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            permission_mode="plan",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
+        deps.codex_executor.execute.return_value = SimpleNamespace(
+            session_id="codex-1",
+            success=True,
+            output="initial",
         )
+        session = _codex_session(id=21, permission_mode="plan")
         plan_directive = PlanModeDirective(
             strategy="splan",
             models=("claude-sonnet-4-6-high", "gpt-5.4-high"),
@@ -488,17 +399,8 @@ class TestCommandRouter:
         mock_request_approval.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_codex_plan_mode_skips_approval_for_non_plan_output(self):
+    async def test_codex_plan_mode_skips_approval_for_non_plan_output(self, deps):
         """Plan mode should not request approval for generic clarification text."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
         deps.codex_executor.execute.return_value = SimpleNamespace(
             session_id="codex-new",
             success=True,
@@ -508,15 +410,7 @@ class TestCommandRouter:
             ),
         )
 
-        session = Session(
-            id=12,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            permission_mode="plan",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=12, permission_mode="plan")
 
         with patch(
             "src.handlers.command_router.PlanApprovalManager.request_approval",
@@ -539,17 +433,9 @@ class TestCommandRouter:
     @pytest.mark.asyncio
     async def test_codex_plan_mode_retries_with_canonical_format_and_requests_approval(
         self,
+        deps,
     ):
         """Non-detected plan responses should trigger one canonical-format retry."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         first_response = SimpleNamespace(
             session_id="codex-new",
@@ -577,15 +463,7 @@ class TestCommandRouter:
         )
         deps.codex_executor.execute = AsyncMock(side_effect=[first_response, second_response])
 
-        session = Session(
-            id=16,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            permission_mode="plan",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=16, permission_mode="plan")
 
         with patch(
             "src.handlers.command_router.PlanApprovalManager.request_approval",
@@ -613,17 +491,8 @@ class TestCommandRouter:
         assert "PLAN_STATUS: READY" not in routed.result.output
 
     @pytest.mark.asyncio
-    async def test_codex_plan_mode_namespaces_tool_activity_ids_per_turn(self):
+    async def test_codex_plan_mode_namespaces_tool_activity_ids_per_turn(self, deps):
         """Post-approval execution tool activity IDs should not collide with plan turn IDs."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         call_index = 0
 
@@ -683,15 +552,7 @@ class TestCommandRouter:
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
 
-        session = Session(
-            id=13,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            permission_mode="plan",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=13, permission_mode="plan")
 
         on_chunk = AsyncMock()
         with patch(
@@ -721,17 +582,8 @@ class TestCommandRouter:
         assert "turn2:item_1" in tool_ids
 
     @pytest.mark.asyncio
-    async def test_codex_plan_mode_can_swap_streaming_callback_after_approval(self):
+    async def test_codex_plan_mode_can_swap_streaming_callback_after_approval(self, deps):
         """Approval hook should be able to move post-approval streaming to a new target."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         initial_on_chunk = AsyncMock()
         replacement_on_chunk = AsyncMock()
@@ -769,15 +621,7 @@ class TestCommandRouter:
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
 
-        session = Session(
-            id=15,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            permission_mode="plan",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=15, permission_mode="plan")
 
         on_plan_approved = AsyncMock(return_value=replacement_on_chunk)
 
@@ -805,33 +649,16 @@ class TestCommandRouter:
     @pytest.mark.asyncio
     async def test_execute_for_session_codex_thread_forks_inherited_channel_thread(
         self,
+        deps,
     ):
         """Thread-scoped Codex sessions should fork inherited channel thread IDs."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                get_or_create_session=AsyncMock(
-                    return_value=Session(codex_session_id="codex-shared")
-                ),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(
-                execute=AsyncMock(
-                    return_value=SimpleNamespace(session_id="codex-forked", success=True, output="")
-                ),
-                thread_fork=AsyncMock(return_value={"thread": {"id": "codex-forked"}}),
-            ),
+        deps.db.get_or_create_session.return_value = Session(codex_session_id="codex-shared")
+        deps.codex_executor.execute.return_value = SimpleNamespace(
+            session_id="codex-forked", success=True, output=""
         )
+        deps.codex_executor.thread_fork.return_value = {"thread": {"id": "codex-forked"}}
 
-        session = Session(
-            id=14,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-shared",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=14, codex_session_id="codex-shared")
 
         await execute_for_session(
             deps=deps,
@@ -857,33 +684,16 @@ class TestCommandRouter:
     @pytest.mark.asyncio
     async def test_execute_for_session_codex_thread_fork_failure_uses_inherited_thread(
         self,
+        deps,
     ):
         """Fork failures should not block execution for thread-scoped Codex sessions."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                get_or_create_session=AsyncMock(
-                    return_value=Session(codex_session_id="codex-shared")
-                ),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(
-                execute=AsyncMock(
-                    return_value=SimpleNamespace(session_id="codex-shared", success=True, output="")
-                ),
-                thread_fork=AsyncMock(side_effect=RuntimeError("fork unavailable")),
-            ),
+        deps.db.get_or_create_session.return_value = Session(codex_session_id="codex-shared")
+        deps.codex_executor.execute.return_value = SimpleNamespace(
+            session_id="codex-shared", success=True, output=""
         )
+        deps.codex_executor.thread_fork.side_effect = RuntimeError("fork unavailable")
 
-        session = Session(
-            id=15,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-shared",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=15, codex_session_id="codex-shared")
         logger = SimpleNamespace(warning=MagicMock(), info=MagicMock())
 
         await execute_for_session(
@@ -899,17 +709,8 @@ class TestCommandRouter:
         assert deps.codex_executor.execute.await_args.kwargs["resume_session_id"] == "codex-shared"
 
     @pytest.mark.asyncio
-    async def test_codex_question_limit_does_not_fail_on_exact_limit(self):
+    async def test_codex_question_limit_does_not_fail_on_exact_limit(self, deps):
         """Hitting exactly the question limit should not force a failed result."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         async def _fake_codex_execute(**kwargs):
             payload = await kwargs["on_user_input_request"](
@@ -931,14 +732,7 @@ class TestCommandRouter:
             )
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
-        session = Session(
-            id=16,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=16)
         pending_question = SimpleNamespace(question_id="pq1", tool_use_id="item_1")
 
         with patch.object(config.timeouts.execution, "max_questions_per_conversation", 1):
@@ -973,17 +767,8 @@ class TestCommandRouter:
         assert routed.result.output == "Implementation complete."
 
     @pytest.mark.asyncio
-    async def test_codex_auto_answers_recommended_queue_questions(self):
+    async def test_codex_auto_answers_recommended_queue_questions(self, deps):
         """Auto-answer mode should bypass Slack question UI for Codex prompts."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         async def _fake_codex_execute(**kwargs):
             payload = await kwargs["on_user_input_request"](
@@ -1009,14 +794,7 @@ class TestCommandRouter:
             return SimpleNamespace(session_id="codex-new", success=True, output="Done.")
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
-        session = Session(
-            id=20,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=20)
 
         with patch(
             "src.handlers.command_router.QuestionManager.create_pending_question",
@@ -1051,17 +829,9 @@ class TestCommandRouter:
     @pytest.mark.asyncio
     async def test_codex_pause_on_questions_posts_question_and_returns_pause_signal(
         self,
+        deps,
     ):
         """Pause-on-question mode should post Slack question UI and end turn for queue pause."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         async def _fake_codex_execute(**kwargs):
             try:
@@ -1089,14 +859,7 @@ class TestCommandRouter:
             return SimpleNamespace(session_id="codex-new", success=True, output="Done.")
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
-        session = Session(
-            id=24,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=24)
         pending_question = SimpleNamespace(question_id="pq-codex", tool_use_id="item_1")
 
         with patch(
@@ -1131,17 +894,8 @@ class TestCommandRouter:
         assert routed.result.error == "__QUEUE_PAUSE_ON_QUESTION__"
 
     @pytest.mark.asyncio
-    async def test_codex_pause_on_questions_replays_deferred_answer(self):
+    async def test_codex_pause_on_questions_replays_deferred_answer(self, deps):
         """Deferred pause-resume answers should be replayed instead of pausing again."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         async def _fake_codex_execute(**kwargs):
             payload = await kwargs["on_user_input_request"](
@@ -1165,14 +919,7 @@ class TestCommandRouter:
             )
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
-        session = Session(
-            id=124,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=124)
 
         with patch(
             "src.handlers.command_router.QuestionManager.consume_deferred_answer",
@@ -1200,17 +947,8 @@ class TestCommandRouter:
         assert getattr(routed.result, "paused_on_question", False) is False
 
     @pytest.mark.asyncio
-    async def test_codex_auto_approves_permissions_for_queue_execution(self):
+    async def test_codex_auto_approves_permissions_for_queue_execution(self, deps):
         """Auto-approve mode should bypass Slack permission UI for Codex prompts."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         async def _fake_codex_execute(**kwargs):
             payload = await kwargs["on_approval_request"](
@@ -1221,14 +959,7 @@ class TestCommandRouter:
             return SimpleNamespace(session_id="codex-new", success=True, output="Done.")
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
-        session = Session(
-            id=22,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=22)
 
         with patch(
             "src.handlers.command_router.PermissionManager.request_approval",
@@ -1251,17 +982,8 @@ class TestCommandRouter:
         assert routed.result.output == "Done."
 
     @pytest.mark.asyncio
-    async def test_codex_question_resume_can_swap_streaming_callback(self):
+    async def test_codex_question_resume_can_swap_streaming_callback(self, deps):
         """Question answers should allow Codex streaming to move to a new Slack message."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         initial_on_chunk = AsyncMock()
         replacement_on_chunk = AsyncMock()
@@ -1290,14 +1012,7 @@ class TestCommandRouter:
             return SimpleNamespace(session_id="codex-new", success=True, output="After answer.")
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
-        session = Session(
-            id=18,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=18)
         pending_question = SimpleNamespace(question_id="pq2", tool_use_id="item_1")
         on_interaction_resumed = AsyncMock(return_value=replacement_on_chunk)
 
@@ -1335,18 +1050,8 @@ class TestCommandRouter:
         assert replacement_on_chunk.await_count == 1
 
     @pytest.mark.asyncio
-    async def test_claude_auto_answers_recommended_queue_questions(self):
+    async def test_claude_auto_answers_recommended_queue_questions(self, deps):
         """Auto-answer mode should resume Claude without waiting for Slack input."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-                get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
 
         prompts: list[str] = []
 
@@ -1398,12 +1103,7 @@ class TestCommandRouter:
             )
 
         deps.executor.execute = AsyncMock(side_effect=_fake_claude_execute)
-        session = Session(
-            id=21,
-            model="opus",
-            working_directory="/tmp",
-            claude_session_id="claude-old",
-        )
+        session = _claude_session(id=21)
 
         with patch(
             "src.handlers.command_router.QuestionManager.post_question_to_slack",
@@ -1434,18 +1134,9 @@ class TestCommandRouter:
     @pytest.mark.asyncio
     async def test_claude_pause_on_questions_posts_question_without_waiting_for_answer(
         self,
+        deps,
     ):
         """Pause-on-question mode should post question UI and return pause signal immediately."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-                get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
 
         async def _fake_claude_execute(**kwargs):
             await kwargs["on_chunk"](
@@ -1484,12 +1175,7 @@ class TestCommandRouter:
             )
 
         deps.executor.execute = AsyncMock(side_effect=_fake_claude_execute)
-        session = Session(
-            id=25,
-            model="opus",
-            working_directory="/tmp",
-            claude_session_id="claude-old",
-        )
+        session = _claude_session(id=25)
         pending_question = SimpleNamespace(
             question_id="pq-claude",
             tool_use_id="tool_1",
@@ -1538,18 +1224,8 @@ class TestCommandRouter:
         assert routed.result.error == "__QUEUE_PAUSE_ON_QUESTION__"
 
     @pytest.mark.asyncio
-    async def test_claude_pause_on_questions_replays_deferred_answer(self):
+    async def test_claude_pause_on_questions_replays_deferred_answer(self, deps):
         """Deferred pause-resume answers should let Claude continue without re-pausing."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-                get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
         prompts: list[str] = []
 
         async def _fake_claude_execute(**kwargs):
@@ -1598,12 +1274,7 @@ class TestCommandRouter:
             )
 
         deps.executor.execute = AsyncMock(side_effect=_fake_claude_execute)
-        session = Session(
-            id=125,
-            model="opus",
-            working_directory="/tmp",
-            claude_session_id="claude-old",
-        )
+        session = _claude_session(id=125)
         pending_question = SimpleNamespace(
             question_id="pq-claude",
             tool_use_id="tool_1",
@@ -1652,18 +1323,8 @@ class TestCommandRouter:
         assert getattr(routed.result, "paused_on_question", False) is False
 
     @pytest.mark.asyncio
-    async def test_claude_plan_rejection_does_not_replay_plan_output(self):
+    async def test_claude_plan_rejection_does_not_replay_plan_output(self, deps):
         """Rejected Claude plans should return a concise status without duplicating plan text."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-                get_or_create_session=AsyncMock(return_value=Session(codex_session_id=None)),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock(), thread_fork=AsyncMock()),
-        )
         deps.executor.execute.return_value = SimpleNamespace(
             session_id="claude-new",
             success=True,
@@ -1680,13 +1341,7 @@ class TestCommandRouter:
             plan_subagent_result="",
         )
 
-        session = Session(
-            id=23,
-            model="opus",
-            working_directory="/tmp",
-            claude_session_id="claude-old",
-            permission_mode="plan",
-        )
+        session = _claude_session(id=23, permission_mode="plan")
 
         with patch(
             "src.handlers.command_router.PlanApprovalManager.request_approval",
@@ -1711,17 +1366,8 @@ class TestCommandRouter:
         assert "# Implementation Plan" not in routed.result.output
 
     @pytest.mark.asyncio
-    async def test_codex_approval_resume_can_swap_streaming_callback(self):
+    async def test_codex_approval_resume_can_swap_streaming_callback(self, deps):
         """Approval decisions should allow Codex streaming to move to a new Slack message."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         initial_on_chunk = AsyncMock()
         replacement_on_chunk = AsyncMock()
@@ -1741,14 +1387,7 @@ class TestCommandRouter:
             return SimpleNamespace(session_id="codex-new", success=True, output="After approval.")
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
-        session = Session(
-            id=19,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=19)
         on_interaction_resumed = AsyncMock(return_value=replacement_on_chunk)
 
         with patch(
@@ -1773,17 +1412,8 @@ class TestCommandRouter:
         assert replacement_on_chunk.await_count == 1
 
     @pytest.mark.asyncio
-    async def test_codex_question_limit_still_fails_when_extra_question_requested(self):
+    async def test_codex_question_limit_still_fails_when_extra_question_requested(self, deps):
         """A question request beyond the limit should still mark the result as failed."""
-        deps = SimpleNamespace(
-            db=SimpleNamespace(
-                update_session_claude_id=AsyncMock(),
-                update_session_codex_id=AsyncMock(),
-                update_session_mode=AsyncMock(),
-            ),
-            executor=SimpleNamespace(execute=AsyncMock()),
-            codex_executor=SimpleNamespace(execute=AsyncMock()),
-        )
 
         async def _fake_codex_execute(**kwargs):
             first_payload = await kwargs["on_user_input_request"](
@@ -1821,14 +1451,7 @@ class TestCommandRouter:
             )
 
         deps.codex_executor.execute = AsyncMock(side_effect=_fake_codex_execute)
-        session = Session(
-            id=17,
-            model="gpt-5.3-codex",
-            working_directory="/tmp",
-            codex_session_id="codex-old",
-            sandbox_mode="workspace-write",
-            approval_mode="on-request",
-        )
+        session = _codex_session(id=17)
         pending_question = SimpleNamespace(question_id="pq1", tool_use_id="item_1")
 
         with patch.object(config.timeouts.execution, "max_questions_per_conversation", 1):
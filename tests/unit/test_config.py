@@ -10,6 +10,7 @@ from src.config import (
     ExecutionTimeouts,
     SlackTimeouts,
     TimeoutConfig,
+    _backend_for_known_model,
     config,
     get_backend_for_model,
     parse_claude_model_effort,
@@ -232,3 +233,10 @@ class TestModelParsingHelpers:
     def test_unknown_gpt_models_route_to_codex_backend(self):
         """GPT-prefixed models should resolve to Codex even when not pre-listed."""
         assert get_backend_for_model("gpt-3.4-high") == "codex"
+
+    def test_known_model_lookup_only_covers_static_tables(self):
+        """Cached exact-match lookup should defer non-listed models to the fallbacks."""
+        assert _backend_for_known_model("opus") == "claude"
+        assert _backend_for_known_model("gpt-5.3-codex-high") == "codex"
+        assert _backend_for_known_model("gemini-2.5-pro") is None
+        assert get_backend_for_model("Opus") == "claude"
@@ -22,7 +22,7 @@ def clear_detail_cache():
 def test_detail_cache_store_get_and_refresh_lru(monkeypatch) -> None:
     """Fetching an entry should return content and move it to the LRU tail."""
     current_time = 1000.0
-    monkeypatch.setattr("src.utils.detail_cache.time.time", lambda: current_time)
+    monkeypatch.setattr("src.utils.detail_cache.time.monotonic", lambda: current_time)
 
     DetailCache.store(1, "first")
     current_time += 1
@@ -35,7 +35,7 @@ def test_detail_cache_store_get_and_refresh_lru(monkeypatch) -> None:
 def test_detail_cache_expires_entries(monkeypatch) -> None:
     """Expired entries should be removed on access."""
     current_time = 1000.0
-    monkeypatch.setattr("src.utils.detail_cache.time.time", lambda: current_time)
+    monkeypatch.setattr("src.utils.detail_cache.time.monotonic", lambda: current_time)
     DetailCache._max_age_seconds = 10
 
     DetailCache.store(1, "first")
@@ -48,7 +48,7 @@ def test_detail_cache_expires_entries(monkeypatch) -> None:
 def test_detail_cache_cleanup_enforces_max_entries(monkeypatch) -> None:
     """Cleanup should evict the least recently used entries when size is exceeded."""
     current_time = 1000.0
-    monkeypatch.setattr("src.utils.detail_cache.time.time", lambda: current_time)
+    monkeypatch.setattr("src.utils.detail_cache.time.monotonic", lambda: current_time)
     DetailCache._max_entries = 2
 
     DetailCache.store(1, "first")
@@ -64,13 +64,44 @@ def test_detail_cache_cleanup_enforces_max_entries(monkeypatch) -> None:
 def test_detail_cache_store_removes_expired_entries_during_cleanup(monkeypatch) -> None:
     """Store-time cleanup should drop expired entries before enforcing size."""
     current_time = 1000.0
-    monkeypatch.setattr("src.utils.detail_cache.time.time", lambda: current_time)
+    monkeypatch.setattr("src.utils.detail_cache.time.monotonic", lambda: current_time)
     DetailCache._max_age_seconds = 10
-    DetailCache._cache[1] = CachedDetail(command_id=1, content="old", created_at=980.0)
+    DetailCache.store(1, "old")
+    current_time += 20
 
     DetailCache.store(2, "fresh")
 
     assert list(DetailCache._cache.keys()) == [2]
+    assert list(DetailCache._expiry_queue) == [(1020.0, 2)]
+
+
+def test_detail_cache_restore_is_not_expired_by_stale_queue_entry(monkeypatch) -> None:
+    """Re-storing a command should reset its TTL despite the older queued timestamp."""
+    current_time = 1000.0
+    monkeypatch.setattr("src.utils.detail_cache.time.monotonic", lambda: current_time)
+    DetailCache._max_age_seconds = 10
+
+    DetailCache.store(1, "first")
+    current_time += 8
+    DetailCache.store(1, "updated")
+    current_time += 8
+    DetailCache.store(2, "second")
+
+    assert DetailCache.get(1) == "updated"
+    assert list(DetailCache._expiry_queue) == [(1008.0, 1), (1016.0, 2)]
+
+
+def test_detail_cache_compacts_expiry_queue_after_repeated_restores(monkeypatch) -> None:
+    """Stale expiry pairs should be dropped once the queue outgrows the cache."""
+    current_time = 1000.0
+    monkeypatch.setattr("src.utils.detail_cache.time.monotonic", lambda: current_time)
+    DetailCache._max_entries = 2
+
+    for _ in range(5):
+        current_time += 1
+        DetailCache.store(1, "same")
+
+    assert list(DetailCache._expiry_queue) == [(1005.0, 1)]
 
 
 def test_detail_cache_clear_empties_cache() -> None:
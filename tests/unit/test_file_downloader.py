@@ -1,17 +1,23 @@
 """Unit tests for file downloader helpers."""
 
 import asyncio
+import warnings
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
+import aiohttp
 import pytest
 
 from src.utils.execution_scope import build_session_scope
 from src.utils.file_downloader import (
+    _DOWNLOAD_CHUNK_SIZE,
     FileDownloadError,
     FileTooLargeError,
+    _get_http_session,
     _prepare_local_path,
+    close_http_session,
+    download_slack_file,
     is_snippet,
     save_snippet_content,
 )
@@ -51,6 +57,40 @@ def test_prepare_local_path_sanitizes_hidden_and_duplicate_names(tmp_path) -> No
     assert hidden.name == "snippet_f2.txt"
 
 
+def test_prepare_local_path_skips_every_taken_numbered_name(tmp_path) -> None:
+    """Collision probing should continue past all existing numbered copies."""
+    for name in ("report.txt", "report_1.txt", "report_2.txt", "report_4.txt"):
+        (tmp_path / name).write_text("taken", encoding="utf-8")
+
+    local_path = _prepare_local_path(
+        destination_dir=str(tmp_path),
+        filename="report.txt",
+        fallback_name="upload_f1",
+    )
+
+    assert local_path == tmp_path / "report_3.txt"
+
+
+def test_prepare_local_path_treats_case_and_unicode_variants_as_collisions(tmp_path) -> None:
+    """Collision checks should hold on case-insensitive, normalizing filesystems."""
+    (tmp_path / "report.txt").write_text("taken", encoding="utf-8")
+    (tmp_path / "Cafe\u0301.txt").write_text("taken", encoding="utf-8")
+
+    case_variant = _prepare_local_path(
+        destination_dir=str(tmp_path),
+        filename="Report.txt",
+        fallback_name="upload_f1",
+    )
+    unicode_variant = _prepare_local_path(
+        destination_dir=str(tmp_path),
+        filename="caf\u00e9.txt",
+        fallback_name="upload_f2",
+    )
+
+    assert case_variant == tmp_path / "Report_1.txt"
+    assert unicode_variant == tmp_path / "caf\u00e9_1.txt"
+
+
 def test_save_snippet_content_writes_content_and_uses_preview_fallback(tmp_path) -> None:
     """Snippet saving should write content locally and fall back to preview text."""
     client = SimpleNamespace(token="xoxb-test")
@@ -120,3 +160,184 @@ def test_save_snippet_content_rejects_oversized_or_empty_content(tmp_path) -> No
                 destination_dir=str(tmp_path),
             )
         )
+
+
+class _FakeStream:
+    def __init__(self, payload: bytes) -> None:
+        self._payload = payload
+        self.chunk_sizes: list[int] = []
+
+    async def iter_chunked(self, size: int):
+        self.chunk_sizes.append(size)
+        for start in range(0, len(self._payload), size):
+            yield self._payload[start : start + size]
+
+
+class _FakeResponse:
+    def __init__(
+        self, payload: bytes, status: int = 200, headers: dict[str, str] | None = None
+    ) -> None:
+        self.status = status
+        self.headers: dict[str, str] = headers or {}
+        self.content = _FakeStream(payload)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class _FakeHttpSession:
+    def __init__(self, response: _FakeResponse) -> None:
+        self.response = response
+        self.requests: list[tuple[str, dict]] = []
+
+    def get(self, url: str, headers: dict, timeout) -> _FakeResponse:
+        self.requests.append((url, headers))
+        return self.response
+
+
+def _files_info_client(size: int):
+    async def files_info(file: str) -> dict:
+        return {
+            "ok": True,
+            "file": {
+                "name": "image.bin",
+                "size": size,
+                "url_private": "https://files.slack.com/image.bin",
+                "mimetype": "application/octet-stream",
+            },
+        }
+
+    return SimpleNamespace(files_info=files_info)
+
+
+def _run_download(
+    tmp_path,
+    payload: bytes,
+    reported_size: int,
+    max_size_bytes: int,
+    status: int = 200,
+    headers: dict[str, str] | None = None,
+):
+    response = _FakeResponse(payload, status=status, headers=headers)
+    http_session = _FakeHttpSession(response)
+
+    with patch(
+        "src.utils.file_downloader._get_http_session",
+        new=AsyncMock(return_value=http_session),
+    ):
+        result = asyncio.run(
+            download_slack_file(
+                client=_files_info_client(reported_size),
+                file_id="F300",
+                slack_bot_token="xoxb-test",
+                destination_dir=str(tmp_path),
+                max_size_bytes=max_size_bytes,
+            )
+        )
+    return result, response, http_session
+
+
+def test_download_slack_file_streams_body_in_large_chunks(tmp_path) -> None:
+    """Downloads should stream the body to disk using the configured chunk size."""
+    payload = b"x" * (_DOWNLOAD_CHUNK_SIZE + 10)
+
+    (local_path, metadata), response, _ = _run_download(
+        tmp_path, payload, reported_size=len(payload), max_size_bytes=10 * len(payload)
+    )
+
+    assert Path(local_path).read_bytes() == payload
+    assert metadata["slack_file_id"] == "F300"
+    assert response.content.chunk_sizes == [_DOWNLOAD_CHUNK_SIZE]
+
+
+def test_download_slack_file_aborts_when_body_exceeds_limit(tmp_path) -> None:
+    """Bodies larger than the limit should be rejected even if Slack under-reports size."""
+    with pytest.raises(FileTooLargeError):
+        _run_download(tmp_path, b"x" * 64, reported_size=0, max_size_bytes=32)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_slack_file_requests_bounded_range_and_accepts_partial_content(
+    tmp_path,
+) -> None:
+    """Downloads should cap the requested range at the limit and accept HTTP 206."""
+    (local_path, _), _, http_session = _run_download(
+        tmp_path, b"abc", reported_size=0, max_size_bytes=32, status=206
+    )
+
+    assert Path(local_path).read_bytes() == b"abc"
+    _, headers = http_session.requests[0]
+    assert headers["Range"] == "bytes=0-32"
+
+
+def test_download_slack_file_treats_unsatisfiable_range_as_empty_file(tmp_path) -> None:
+    """A 416 for bytes=0-N means the file is empty, so an empty file is saved."""
+    (local_path, metadata), _, _ = _run_download(
+        tmp_path,
+        b"<Error>InvalidRange</Error>",
+        reported_size=0,
+        max_size_bytes=32,
+        status=416,
+        headers={"Content-Range": "bytes */0"},
+    )
+
+    assert Path(local_path).read_bytes() == b""
+    assert metadata["size"] == 0
+
+
+def test_download_slack_file_reports_full_size_from_content_range(tmp_path) -> None:
+    """An oversized file served as a 206 slice is rejected with its real size."""
+    full_size = 5 * 1024 * 1024
+
+    with pytest.raises(FileTooLargeError) as exc_info:
+        _run_download(
+            tmp_path,
+            b"x" * 33,
+            reported_size=0,
+            max_size_bytes=32,
+            status=206,
+            headers={"Content-Length": "33", "Content-Range": f"bytes 0-32/{full_size}"},
+        )
+
+    assert exc_info.value.size_mb == 5.0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_shared_http_session_is_reused_within_a_loop_and_closed_on_shutdown() -> None:
+    """The download session should be shared per event loop and reset by close."""
+
+    async def _exercise() -> None:
+        first = await _get_http_session()
+        assert await _get_http_session() is first
+        await close_http_session()
+        assert first.closed is True
+        second = await _get_http_session()
+        assert second is not first
+        await close_http_session()
+
+    asyncio.run(_exercise())
+
+
+def test_shared_http_session_from_a_finished_loop_is_closed_when_replaced() -> None:
+    """A new event loop should close the session left open by the previous one."""
+
+    async def _open() -> aiohttp.ClientSession:
+        return await _get_http_session()
+
+    async def _reopen() -> aiohttp.ClientSession:
+        session = await _get_http_session()
+        await close_http_session()
+        return session
+
+    first = asyncio.run(_open())
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        second = asyncio.run(_reopen())
+
+    assert second is not first
+    assert first.closed is True
+    assert second.closed is True
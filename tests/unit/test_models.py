@@ -1,8 +1,9 @@
 """Unit tests for database models."""
 
-import json
 from datetime import datetime
 
+import pytest
+
 from src.config import is_supported_codex_model, parse_model_effort
 from src.database.models import (
     CommandHistory,
@@ -18,101 +19,100 @@ from src.database.models import (
 class TestSession:
     """Tests for Session model."""
 
-    def test_from_row_current_schema(self):
-        """from_row handles the current session schema."""
-        row = (
-            1,  # id
-            "C123ABC",  # channel_id
-            "1234567890.123456",  # thread_ts
-            "/home/user",  # working_directory
-            "session-abc123",  # claude_session_id
-            "plan",  # permission_mode
-            "2024-01-15T10:30:00",  # created_at
-            "2024-01-15T11:00:00",  # last_active
-            "opus",  # model
-            "[]",  # added_dirs
-            None,  # codex_session_id
-            "workspace-write",  # sandbox_mode
-            "on-request",  # approval_mode
-        )
-
+    @pytest.mark.parametrize(
+        ("row", "expected"),
+        [
+            # Current schema, Claude session
+            (
+                (
+                    1,  # id
+                    "C123ABC",  # channel_id
+                    "1234567890.123456",  # thread_ts
+                    "/home/user",  # working_directory
+                    "session-abc123",  # claude_session_id
+                    "plan",  # permission_mode
+                    "2024-01-15T10:30:00",  # created_at
+                    "2024-01-15T11:00:00",  # last_active
+                    "opus",  # model
+                    "[]",  # added_dirs
+                    None,  # codex_session_id
+                    "workspace-write",  # sandbox_mode
+                    "on-request",  # approval_mode
+                ),
+                {
+                    "id": 1,
+                    "channel_id": "C123ABC",
+                    "thread_ts": "1234567890.123456",
+                    "working_directory": "/home/user",
+                    "claude_session_id": "session-abc123",
+                    "permission_mode": "plan",
+                    "model": "opus",
+                    "created_at": datetime(2024, 1, 15, 10, 30),
+                    "last_active": datetime(2024, 1, 15, 11, 0),
+                },
+            ),
+            # Full schema with Codex fields
+            (
+                (
+                    1,  # id
+                    "C123ABC",  # channel_id
+                    "1234567890.123456",  # thread_ts
+                    "/home/user",  # working_directory
+                    "session-abc123",  # claude_session_id
+                    "plan",  # permission_mode
+                    "2024-01-15T10:30:00",  # created_at
+                    "2024-01-15T11:00:00",  # last_active
+                    "gpt-5.3-codex",  # model
+                    "[]",  # added_dirs (JSON)
+                    "codex-session-456",  # codex_session_id
+                    "danger-full-access",  # sandbox_mode
+                    "never",  # approval_mode
+                ),
+                {
+                    "id": 1,
+                    "model": "gpt-5.3-codex",
+                    "codex_session_id": "codex-session-456",
+                    "sandbox_mode": "danger-full-access",
+                    "approval_mode": "never",
+                },
+            ),
+        ],
+    )
+    def test_from_row_schema(self, row, expected):
+        """from_row maps each schema column onto the matching Session field."""
         session = Session.from_row(row)
 
-        assert session.id == 1
-        assert session.channel_id == "C123ABC"
-        assert session.thread_ts == "1234567890.123456"
-        assert session.working_directory == "/home/user"
-        assert session.claude_session_id == "session-abc123"
-        assert session.permission_mode == "plan"
-        assert session.model == "opus"
-        assert session.created_at == datetime.fromisoformat("2024-01-15T10:30:00")
-        assert session.last_active == datetime.fromisoformat("2024-01-15T11:00:00")
-
-    def test_from_row_full_schema_with_codex(self):
-        """from_row handles full schema with Codex fields."""
-        row = (
-            1,  # id
-            "C123ABC",  # channel_id
-            "1234567890.123456",  # thread_ts
-            "/home/user",  # working_directory
-            "session-abc123",  # claude_session_id
-            "plan",  # permission_mode
-            "2024-01-15T10:30:00",  # created_at
-            "2024-01-15T11:00:00",  # last_active
-            "gpt-5.3-codex",  # model
-            "[]",  # added_dirs (JSON)
-            "codex-session-456",  # codex_session_id
-            "danger-full-access",  # sandbox_mode
-            "never",  # approval_mode
-        )
-
-        session = Session.from_row(row)
-
-        assert session.id == 1
-        assert session.model == "gpt-5.3-codex"
-        assert session.codex_session_id == "codex-session-456"
-        assert session.sandbox_mode == "danger-full-access"
-        assert session.approval_mode == "never"
-
-    def test_get_backend_claude(self):
+        actual = {name: getattr(session, name) for name in expected}
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            "opus",
+            "default",
+            "claude-opus-4-6[1m]",
+            "claude-sonnet-4-6[1m]",
+            "claude-haiku-4-5",
+        ],
+    )
+    def test_get_backend_claude(self, model):
         """get_backend returns 'claude' for Claude models."""
-        session = Session(channel_id="C123", model="opus")
-        assert session.get_backend() == "claude"
-
-        session = Session(channel_id="C123", model="default")
-        assert session.get_backend() == "claude"
-
-        session = Session(channel_id="C123", model="claude-opus-4-6[1m]")
-        assert session.get_backend() == "claude"
-
-        session = Session(channel_id="C123", model="claude-sonnet-4-6[1m]")
-        assert session.get_backend() == "claude"
-
-        session = Session(channel_id="C123", model="claude-haiku-4-5")
-        assert session.get_backend() == "claude"
+        assert Session(channel_id="C123", model=model).get_backend() == "claude"
 
-    def test_get_backend_codex(self):
+    @pytest.mark.parametrize(
+        "model",
+        [
+            "gpt-5.3-codex",
+            "gpt-5.3-codex-spark",
+            "gpt-5.1-codex-max",
+            "gpt-5.2",
+            "gpt-5.3-codex-high",
+            "gpt-5.3-codex-extra-high",
+        ],
+    )
+    def test_get_backend_codex(self, model):
         """get_backend returns 'codex' for Codex models."""
-        session = Session(channel_id="C123", model="gpt-5.3-codex")
-        assert session.get_backend() == "codex"
-
-        session = Session(channel_id="C123", model="gpt-5.3-codex-spark")
-        assert session.get_backend() == "codex"
-
-        session = Session(channel_id="C123", model="gpt-5.3-codex")
-        assert session.get_backend() == "codex"
-
-        session = Session(channel_id="C123", model="gpt-5.1-codex-max")
-        assert session.get_backend() == "codex"
-
-        session = Session(channel_id="C123", model="gpt-5.2")
-        assert session.get_backend() == "codex"
-
-        session = Session(channel_id="C123", model="gpt-5.3-codex-high")
-        assert session.get_backend() == "codex"
-
-        session = Session(channel_id="C123", model="gpt-5.3-codex-extra-high")
-        assert session.get_backend() == "codex"
+        assert Session(channel_id="C123", model=model).get_backend() == "codex"
 
     def test_get_backend_unknown_gpt_routes_to_codex(self):
         """GPT-prefixed model IDs should route to Codex backend selection."""
@@ -172,45 +172,35 @@ class TestSession:
 class TestParseModelEffort:
     """Tests for parse_model_effort utility."""
 
-    def test_no_effort_suffix(self):
-        """Returns None effort when no suffix present."""
-        assert parse_model_effort("gpt-5.3-codex") == ("gpt-5.3-codex", None)
-        assert parse_model_effort("opus") == ("opus", None)
-
-    def test_effort_suffixes(self):
-        """Parses all effort level suffixes correctly."""
-        assert parse_model_effort("gpt-5.3-codex-low") == ("gpt-5.3-codex", "low")
-        assert parse_model_effort("gpt-5.3-codex-medium") == ("gpt-5.3-codex", "medium")
-        assert parse_model_effort("gpt-5.3-codex-high") == ("gpt-5.3-codex", "high")
-        assert parse_model_effort("gpt-5.3-codex-xhigh") == ("gpt-5.3-codex", "xhigh")
-
-    def test_max_model_with_effort(self):
-        """Handles models ending in -max correctly (not confused with effort)."""
-        assert parse_model_effort("gpt-5.1-codex-max") == ("gpt-5.1-codex-max", None)
-        assert parse_model_effort("gpt-5.1-codex-max-high") == (
-            "gpt-5.1-codex-max",
-            "high",
-        )
-        assert parse_model_effort("gpt-5.1-codex-max-xhigh") == (
-            "gpt-5.1-codex-max",
-            "xhigh",
-        )
-
-    def test_mini_model_with_effort(self):
-        """Handles models ending in -mini correctly."""
-        assert parse_model_effort("gpt-5.1-codex-mini") == ("gpt-5.1-codex-mini", None)
-        assert parse_model_effort("gpt-5.1-codex-mini-low") == (
-            "gpt-5.1-codex-mini",
-            "low",
-        )
-
-    def test_case_insensitive(self):
-        """Parsing is case-insensitive."""
-        assert parse_model_effort("GPT-5.3-CODEX-HIGH") == ("GPT-5.3-CODEX", "high")
-        assert parse_model_effort("GPT-5.3-CODEX-EXTRA-HIGH") == (
-            "GPT-5.3-CODEX",
-            "xhigh",
-        )
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            # No effort suffix
+            ("gpt-5.3-codex", ("gpt-5.3-codex", None)),
+            ("opus", ("opus", None)),
+            # Every effort level suffix
+            ("gpt-5.3-codex-low", ("gpt-5.3-codex", "low")),
+            ("gpt-5.3-codex-medium", ("gpt-5.3-codex", "medium")),
+            ("gpt-5.3-codex-high", ("gpt-5.3-codex", "high")),
+            ("gpt-5.3-codex-xhigh", ("gpt-5.3-codex", "xhigh")),
+            ("gpt-5.3-codex-extra-high", ("gpt-5.3-codex", "xhigh")),
+            ("gpt-5.3-codex-extra_high", ("gpt-5.3-codex", "xhigh")),
+            ("gpt-5.3-codex-extrahigh", ("gpt-5.3-codex", "xhigh")),
+            # Models ending in -max are not confused with an effort suffix
+            ("gpt-5.1-codex-max", ("gpt-5.1-codex-max", None)),
+            ("gpt-5.1-codex-max-high", ("gpt-5.1-codex-max", "high")),
+            ("gpt-5.1-codex-max-xhigh", ("gpt-5.1-codex-max", "xhigh")),
+            # Models ending in -mini
+            ("gpt-5.1-codex-mini", ("gpt-5.1-codex-mini", None)),
+            ("gpt-5.1-codex-mini-low", ("gpt-5.1-codex-mini", "low")),
+            # Case-insensitive suffix matching
+            ("GPT-5.3-CODEX-HIGH", ("GPT-5.3-CODEX", "high")),
+            ("GPT-5.3-CODEX-EXTRA-HIGH", ("GPT-5.3-CODEX", "xhigh")),
+        ],
+    )
+    def test_parse_model_effort(self, model, expected):
+        """Splits model IDs into base model and effort level."""
+        assert parse_model_effort(model) == expected
 
 
 class TestSupportedCodexModels:
@@ -257,7 +247,7 @@ class TestCommandHistory:
         assert cmd.output == "Analysis complete"
         assert cmd.status == "completed"
         assert cmd.error_message is None
-        assert cmd.completed_at == datetime.fromisoformat("2024-01-15T10:35:00")
+        assert cmd.completed_at == datetime(2024, 1, 15, 10, 35)
 
     def test_from_row_failed(self):
         """from_row parses failed command with error."""
@@ -289,23 +279,28 @@ class TestCommandHistory:
         assert cmd.error_message is None
         assert cmd.completed_at is None
 
+    def test_is_slotted(self):
+        """CommandHistory rows carry no per-instance __dict__."""
+        cmd = CommandHistory()
+
+        assert not hasattr(cmd, "__dict__")
+        with pytest.raises(AttributeError):
+            cmd.unexpected = "value"
+
 
 class TestParallelJob:
     """Tests for ParallelJob model."""
 
     def test_from_row_complete(self):
         """from_row parses complete job correctly."""
-        config_json = json.dumps({"n_instances": 3, "commands": ["cmd1", "cmd2"]})
-        results_json = json.dumps([{"output": "result1"}, {"output": "result2"}])
-
         row = (
             1,  # id
             5,  # session_id
             "C123",  # channel_id
             "parallel_analysis",  # job_type
             "completed",  # status
-            config_json,  # config
-            results_json,  # results
+            '{"n_instances": 3, "commands": ["cmd1", "cmd2"]}',  # config
+            '[{"output": "result1"}, {"output": "result2"}]',  # results
             "aggregated output",  # aggregation_output
             "1234567890.123456",  # message_ts
             "2024-01-15T10:30:00",  # created_at
@@ -368,7 +363,7 @@ class TestQueueItem:
         assert item.parallel_limit == 2
         assert item.status == "running"
         assert item.position == 5
-        assert item.started_at == datetime.fromisoformat("2024-01-15T10:31:00")
+        assert item.started_at == datetime(2024, 1, 15, 10, 31)
         assert item.completed_at is None
 
     def test_default_values(self):
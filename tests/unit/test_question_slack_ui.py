@@ -1,7 +1,9 @@
 """Unit tests for AskUserQuestion Slack UI rendering."""
 
+import json
+
+from src.question import slack_ui
 from src.question.manager import PendingQuestion, Question, QuestionOption
-from src.question.slack_ui import build_question_blocks
 
 
 def test_single_select_question_renders_all_options_across_multiple_action_blocks():
@@ -24,7 +26,7 @@ def test_single_select_question_renders_all_options_across_multiple_action_block
         ],
     )
 
-    blocks = build_question_blocks(pending)
+    blocks = slack_ui.build_question_blocks(pending)
     action_blocks = [
         block
         for block in blocks
@@ -68,7 +70,7 @@ def test_multi_select_question_shows_overflow_warning_when_options_exceed_limit(
         ],
     )
 
-    blocks = build_question_blocks(pending)
+    blocks = slack_ui.build_question_blocks(pending)
     checkbox_block = next(
         block
         for block in blocks
@@ -85,3 +87,150 @@ def test_multi_select_question_shows_overflow_warning_when_options_exceed_limit(
         and "additional option(s) omitted" in block.get("elements", [{}])[0].get("text", "")
     )
     assert "Showing first 10 options" in overflow_context["elements"][0]["text"]
+
+
+def test_button_values_and_modal_metadata_decode_as_json():
+    """Encoded option payloads should round-trip through ``json.loads`` without labels."""
+    pending = PendingQuestion(
+        question_id="q789",
+        session_id="s1",
+        channel_id="C123",
+        thread_ts=None,
+        tool_use_id="tool1",
+        questions=[
+            Question(
+                id="q1",
+                question="Pick one",
+                header="Choice",
+                options=[QuestionOption(label="Café ☕")],
+                multi_select=False,
+            )
+        ],
+    )
+
+    blocks = slack_ui.build_question_blocks(pending)
+    buttons = [
+        element
+        for block in blocks
+        if block.get("type") == "actions"
+        for element in block["elements"]
+    ]
+    assert json.loads(buttons[0]["value"]) == {"q": "q789", "i": 0, "o": 0}
+    assert json.loads(buttons[-1]["value"]) == {"q": "q789", "i": 0}
+
+    modal = slack_ui.build_custom_answer_modal("q789", 2, "Choice")
+    assert json.loads(modal["private_metadata"]) == {"q": "q789", "i": 2}
+
+
+def test_question_result_blocks_render_all_answers_in_one_rich_text_block():
+    """Answered questions should render together, with a placeholder for missing answers."""
+    pending = PendingQuestion(
+        question_id="q900",
+        session_id="s1",
+        channel_id="C123",
+        thread_ts=None,
+        tool_use_id="tool1",
+        questions=[
+            Question(id="q1", question="Pick one", header="First", options=[]),
+            Question(id="q2", question="Pick more", header="Second", options=[]),
+        ],
+    )
+    pending.answers = {0: ["A", "B"]}
+
+    blocks = slack_ui.build_question_result_blocks(pending, "U1")
+
+    assert [block["type"] for block in blocks] == ["header", "divider", "rich_text"]
+    texts = [
+        element["text"] for section in blocks[2]["elements"] for element in section["elements"]
+    ]
+    assert "First" in texts and "Second" in texts
+    assert " A, B" in texts
+    assert " (no answer)" in texts
+
+
+def test_custom_answer_modal_truncates_label_and_keeps_per_question_metadata():
+    """Modals for the same header should differ only in their question metadata."""
+    first = slack_ui.build_custom_answer_modal("q1", 0, "A very long question header value")
+    second = slack_ui.build_custom_answer_modal("q2", 1, "A very long question header value")
+
+    assert first["blocks"][0]["label"]["text"] == "A very long question hea"
+    assert first["blocks"] == second["blocks"]
+    assert json.loads(first["private_metadata"]) == {"q": "q1", "i": 0}
+    assert json.loads(second["private_metadata"]) == {"q": "q2", "i": 1}
+
+
+def test_question_blocks_without_questions_only_render_header_and_context():
+    """An empty question list should skip option rendering and the confirm button."""
+    pending = PendingQuestion(
+        question_id="q000",
+        session_id="s1",
+        channel_id="C123",
+        thread_ts=None,
+        tool_use_id="tool1",
+        questions=[],
+    )
+
+    assert [block["type"] for block in slack_ui.build_question_blocks(pending)] == [
+        "header",
+        "divider",
+    ]
+    with_context = slack_ui.build_question_blocks(pending, context_text="Why I ask")
+    assert [block["type"] for block in with_context] == [
+        "header",
+        "divider",
+        "rich_text",
+        "divider",
+    ]
+
+
+def test_question_option_precomputes_slack_truncated_text():
+    """Options should expose Slack-safe label/description text without affecting equality."""
+    option = QuestionOption(label="L" * 100, description="D" * 100)
+
+    assert option.slack_label == "L" * 75
+    assert option.slack_description == "D" * 75
+    assert option == QuestionOption(label="L" * 100, description="D" * 100)
+
+
+def test_confirm_button_only_added_for_multi_select_or_multiple_questions():
+    """Single single-select questions auto-resolve; everything else needs Confirm."""
+
+    def _pending(*multi_select_flags: bool) -> PendingQuestion:
+        return PendingQuestion(
+            question_id="qc",
+            session_id="s1",
+            channel_id="C123",
+            thread_ts=None,
+            tool_use_id="tool1",
+            questions=[
+                Question(
+                    id=f"q{i}",
+                    question="Pick",
+                    header="Choice",
+                    options=[QuestionOption(label="A")],
+                    multi_select=flag,
+                )
+                for i, flag in enumerate(multi_select_flags)
+            ],
+        )
+
+    def _has_confirm(pending: PendingQuestion) -> bool:
+        return any(
+            block.get("block_id") == "question_submit_qc"
+            for block in slack_ui.build_question_blocks(pending)
+        )
+
+    assert _has_confirm(_pending(False)) is False
+    assert _has_confirm(_pending(True)) is True
+    assert _has_confirm(_pending(False, False)) is True
+
+
+def test_custom_answer_modal_block_lists_are_not_shared_between_renders():
+    """Changing one modal's block list should not affect later modals with the same label."""
+    first = slack_ui.build_custom_answer_modal("q1", 0, "Your Answer")
+    first["blocks"].append({"type": "divider"})
+
+    second = slack_ui.build_custom_answer_modal("q2", 0, "Your Answer")
+
+    assert len(second["blocks"]) == 1
+    assert second["blocks"][0]["block_id"] == "custom_answer_block"
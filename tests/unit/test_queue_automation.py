@@ -106,10 +106,11 @@ class TestParseTaskStatusBlock:
         report = parse_task_status_block(output)
         assert report is not None
         assert report.status_complete is False
-        assert len(report.original_tasks) == 3
-        assert report.original_tasks[0] == ("DONE", "Implement the login endpoint")
-        assert report.original_tasks[1] == ("INCOMPLETE", "Add rate limiting to the login endpoint")
-        assert report.original_tasks[2] == ("INCOMPLETE", "Write tests for the login endpoint")
+        assert report.original_tasks == [
+            ("DONE", "Implement the login endpoint"),
+            ("INCOMPLETE", "Add rate limiting to the login endpoint"),
+            ("INCOMPLETE", "Write tests for the login endpoint"),
+        ]
         assert report.discovered_tasks == []
 
     def test_parses_incomplete_with_discovered_tasks(self) -> None:
@@ -130,13 +131,13 @@ class TestParseTaskStatusBlock:
         report = parse_task_status_block(output)
         assert report is not None
         assert report.status_complete is False
-        assert len(report.original_tasks) == 1
-        assert report.original_tasks[0] == ("DONE", "Build the API")
-        assert len(report.discovered_tasks) == 4
-        assert report.discovered_tasks[0] == ("CRITICAL", "Fix broken CORS middleware")
-        assert report.discovered_tasks[1] == ("HIGH", "Refactor auth helper to reduce duplication")
-        assert report.discovered_tasks[2] == ("MEDIUM", "Add docstrings to new functions")
-        assert report.discovered_tasks[3] == ("LOW", "Clean up unused imports")
+        assert report.original_tasks == [("DONE", "Build the API")]
+        assert report.discovered_tasks == [
+            ("CRITICAL", "Fix broken CORS middleware"),
+            ("HIGH", "Refactor auth helper to reduce duplication"),
+            ("MEDIUM", "Add docstrings to new functions"),
+            ("LOW", "Clean up unused imports"),
+        ]
 
     def test_parses_complete_with_low_discovered_tasks(self) -> None:
         output = (
@@ -153,8 +154,7 @@ class TestParseTaskStatusBlock:
         report = parse_task_status_block(output)
         assert report is not None
         assert report.status_complete is True
-        assert len(report.discovered_tasks) == 1
-        assert report.discovered_tasks[0] == ("LOW", "Minor formatting cleanup")
+        assert report.discovered_tasks == [("LOW", "Minor formatting cleanup")]
 
     def test_returns_none_when_status_line_missing(self) -> None:
         output = "<task-status>\n" "[original-plan]\n" "- DONE | Something\n" "</task-status>"
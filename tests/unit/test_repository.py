@@ -1,6 +1,7 @@
 """Unit tests for database repository."""
 
 import asyncio
+import math
 from datetime import datetime, timedelta, timezone
 
 import aiosqlite
@@ -1257,6 +1258,21 @@ class TestParallelJobOperations:
         assert updated.aggregation_output == "Summary"
         assert updated.completed_at is not None
 
+    @pytest.mark.asyncio
+    async def test_parallel_job_round_trips_stdlib_only_json(self, db_repo):
+        """Values json.dumps writes but orjson rejects still load from stored rows."""
+        session = await db_repo.get_or_create_session("C123ABC", None)
+        wide_int = 2**70
+        job = await db_repo.create_parallel_job(
+            session.id, "C123ABC", "test", {"seed": wide_int, "limit": float("inf")}
+        )
+        await db_repo.update_parallel_job(job.id, results=[{"score": float("nan")}])
+
+        loaded = await db_repo.get_parallel_job(job.id)
+
+        assert loaded.config == {"seed": wide_int, "limit": float("inf")}
+        assert math.isnan(loaded.results[0]["score"])
+
     @pytest.mark.asyncio
     async def test_get_active_jobs(self, db_repo):
         """get_active_jobs returns pending/running jobs."""
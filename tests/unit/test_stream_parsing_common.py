@@ -1,6 +1,10 @@
 """Unit tests for shared stream parsing helpers."""
 
+import pytest
+
 from src.backends import stream_parsing_common as common
+from src.claude.sdk_stream_adapter import ToolActivity as ClaudeToolActivity
+from src.codex.streaming import ToolActivity as CodexToolActivity
 from src.utils.stream_models import BaseToolActivity
 
 
@@ -130,3 +134,12 @@ def test_create_tool_result_handles_pending_and_unknown_tools(monkeypatch) -> No
     assert unknown_activities[0].name == "unknown"
     assert unknown_activities[0].is_error is True
     assert "[Tool Result: ERROR]" in unknown_details
+
+
+def test_backend_tool_activities_reject_unknown_attributes() -> None:
+    """Backend tool activities should stay slotted so stray attributes fail fast."""
+    for tool_cls in (ClaudeToolActivity, CodexToolActivity):
+        activity = tool_cls("t1", "Read", {}, "", None, None, False, 12)
+        assert activity.duration_ms == 12
+        with pytest.raises(AttributeError):
+            activity.unexpected = True
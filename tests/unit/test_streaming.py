@@ -10,6 +10,18 @@ from src.utils.stream_models import concat_with_spacing as _concat_with_spacing
 from src.utils.streaming import StreamingMessageState, create_streaming_callback
 
 
+@pytest.fixture
+def client() -> AsyncMock:
+    """Async Slack client stub for streaming state tests."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def logger() -> MagicMock:
+    """Logger stub for streaming state tests."""
+    return MagicMock()
+
+
 class TestConcatWithSpacing:
     """Tests for _concat_with_spacing helper."""
 
@@ -203,14 +215,14 @@ class TestStreamingHeartbeat:
     """Tests for heartbeat functionality."""
 
     @pytest.mark.asyncio
-    async def test_start_heartbeat_creates_task(self):
+    async def test_start_heartbeat_creates_task(self, client, logger):
         """start_heartbeat creates a background task."""
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
-            client=AsyncMock(),
-            logger=MagicMock(),
+            client=client,
+            logger=logger,
         )
 
         state.start_heartbeat()
@@ -222,14 +234,14 @@ class TestStreamingHeartbeat:
         await state.stop_heartbeat()
 
     @pytest.mark.asyncio
-    async def test_stop_heartbeat_cancels_task(self):
+    async def test_stop_heartbeat_cancels_task(self, client, logger):
         """stop_heartbeat cancels the background task."""
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
-            client=AsyncMock(),
-            logger=MagicMock(),
+            client=client,
+            logger=logger,
         )
 
         state.start_heartbeat()
@@ -241,14 +253,14 @@ class TestStreamingHeartbeat:
         assert task.done() or task.cancelled()
 
     @pytest.mark.asyncio
-    async def test_stop_heartbeat_idempotent(self):
+    async def test_stop_heartbeat_idempotent(self, client, logger):
         """stop_heartbeat is safe to call multiple times."""
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
-            client=AsyncMock(),
-            logger=MagicMock(),
+            client=client,
+            logger=logger,
         )
 
         # Should not raise even without starting
@@ -262,15 +274,14 @@ class TestStreamingAppendAndUpdate:
     """Tests for append_and_update functionality."""
 
     @pytest.mark.asyncio
-    async def test_append_accumulates_content(self):
+    async def test_append_accumulates_content(self, client, logger):
         """append_and_update accumulates output content."""
-        client = AsyncMock()
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
             client=client,
-            logger=MagicMock(),
+            logger=logger,
         )
 
         await state.append_and_update("Hello ")
@@ -280,15 +291,16 @@ class TestStreamingAppendAndUpdate:
         assert "world!" in state.accumulated_output
 
     @pytest.mark.asyncio
-    async def test_append_preserves_raw_codex_deltas_when_smart_concat_disabled(self):
+    async def test_append_preserves_raw_codex_deltas_when_smart_concat_disabled(
+        self, client, logger
+    ):
         """Raw delta streams should not get synthetic spaces inserted mid-word."""
-        client = AsyncMock()
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
             client=client,
-            logger=MagicMock(),
+            logger=logger,
             smart_concat=False,
         )
 
@@ -299,15 +311,14 @@ class TestStreamingAppendAndUpdate:
         assert state.accumulated_output == "existing slippage/fill calibration"
 
     @pytest.mark.asyncio
-    async def test_append_can_insert_spacing_when_smart_concat_enabled(self):
+    async def test_append_can_insert_spacing_when_smart_concat_enabled(self, client, logger):
         """Claude-style smart concat may add spacing between coarse chunks."""
-        client = AsyncMock()
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
             client=client,
-            logger=MagicMock(),
+            logger=logger,
             smart_concat=True,
         )
 
@@ -317,15 +328,14 @@ class TestStreamingAppendAndUpdate:
         assert state.accumulated_output == "Found it. Now checking."
 
     @pytest.mark.asyncio
-    async def test_append_tracks_tools(self):
+    async def test_append_tracks_tools(self, client, logger):
         """append_and_update tracks tool activities when enabled."""
-        client = AsyncMock()
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
             client=client,
-            logger=MagicMock(),
+            logger=logger,
             track_tools=True,
         )
 
@@ -342,15 +352,14 @@ class TestStreamingAppendAndUpdate:
         assert state.tool_activities["tool-123"].name == "Read"
 
     @pytest.mark.asyncio
-    async def test_append_updates_existing_tool(self):
+    async def test_append_updates_existing_tool(self, client, logger):
         """append_and_update updates existing tool with result."""
-        client = AsyncMock()
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
             client=client,
-            logger=MagicMock(),
+            logger=logger,
             track_tools=True,
         )
 
@@ -380,15 +389,14 @@ class TestStreamingAppendAndUpdate:
         assert state.tool_activities["tool-123"].duration_ms == 100
 
     @pytest.mark.asyncio
-    async def test_send_update_uses_processing_fallback_text_without_output(self):
+    async def test_send_update_uses_processing_fallback_text_without_output(self, client, logger):
         """Message updates should include plain-text fallback when output is empty."""
-        client = AsyncMock()
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="inspect the queue worker for regressions",
             client=client,
-            logger=MagicMock(),
+            logger=logger,
         )
 
         await state._send_update()
@@ -400,15 +408,14 @@ class TestCreateStreamingCallback:
     """Tests for create_streaming_callback factory."""
 
     @pytest.mark.asyncio
-    async def test_callback_updates_state_on_assistant_message(self):
+    async def test_callback_updates_state_on_assistant_message(self, client, logger):
         """Callback updates state for assistant messages."""
-        client = AsyncMock()
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
             client=client,
-            logger=MagicMock(),
+            logger=logger,
         )
 
         callback = create_streaming_callback(state)
@@ -424,15 +431,14 @@ class TestCreateStreamingCallback:
         assert "Hello from Claude" in state.accumulated_output
 
     @pytest.mark.asyncio
-    async def test_callback_ignores_non_assistant_messages(self):
+    async def test_callback_ignores_non_assistant_messages(self, client, logger):
         """Callback ignores non-assistant message types."""
-        client = AsyncMock()
         state = StreamingMessageState(
             channel_id="C123",
             message_ts="123.456",
             prompt="test",
             client=client,
-            logger=MagicMock(),
+            logger=logger,
         )
 
         callback = create_streaming_callback(state)
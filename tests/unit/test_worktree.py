@@ -9,6 +9,12 @@ from src.git.models import Worktree
 from src.git.service import GitError, GitService
 
 
+@pytest.fixture
+def service() -> GitService:
+    """GitService under test; individual tests patch its git calls."""
+    return GitService()
+
+
 class TestWorktreeModel:
     """Tests for Worktree dataclass."""
 
@@ -47,107 +53,98 @@ class TestWorktreeModel:
 class TestListWorktrees:
     """Tests for GitService.list_worktrees."""
 
+    @pytest.mark.parametrize(
+        ("porcelain_output", "expected"),
+        [
+            # Main worktree plus a linked branch worktree
+            (
+                "worktree /home/user/project\n"
+                "HEAD abc123def456\n"
+                "branch refs/heads/main\n"
+                "\n"
+                "worktree /home/user/project-worktrees/feature-x\n"
+                "HEAD def456abc789\n"
+                "branch refs/heads/feature-x\n"
+                "\n",
+                [
+                    Worktree(
+                        path="/home/user/project",
+                        branch="main",
+                        commit="abc123def456",
+                        is_main=True,
+                    ),
+                    Worktree(
+                        path="/home/user/project-worktrees/feature-x",
+                        branch="feature-x",
+                        commit="def456abc789",
+                    ),
+                ],
+            ),
+            # Detached, locked and prunable metadata
+            (
+                "worktree /home/user/project\n"
+                "HEAD abc123\n"
+                "branch refs/heads/main\n"
+                "\n"
+                "worktree /home/user/project-worktrees/detached\n"
+                "HEAD def456\n"
+                "detached\n"
+                "locked admin lock\n"
+                "prunable stale gitdir file\n"
+                "\n",
+                [
+                    Worktree(
+                        path="/home/user/project", branch="main", commit="abc123", is_main=True
+                    ),
+                    Worktree(
+                        path="/home/user/project-worktrees/detached",
+                        branch="(detached HEAD)",
+                        commit="def456",
+                        is_detached=True,
+                        is_locked=True,
+                        lock_reason="admin lock",
+                        is_prunable=True,
+                        prunable_reason="stale gitdir file",
+                    ),
+                ],
+            ),
+            # Only the main worktree
+            (
+                "worktree /home/user/project\n" "HEAD abc123\n" "branch refs/heads/main\n" "\n",
+                [
+                    Worktree(
+                        path="/home/user/project", branch="main", commit="abc123", is_main=True
+                    ),
+                ],
+            ),
+            # No trailing blank line
+            (
+                "worktree /home/user/project\n" "HEAD abc123\n" "branch refs/heads/main",
+                [
+                    Worktree(
+                        path="/home/user/project", branch="main", commit="abc123", is_main=True
+                    ),
+                ],
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_parses_porcelain_output(self, tmp_path):
+    async def test_parses_porcelain_output(self, tmp_path, service, porcelain_output, expected):
         """list_worktrees parses git worktree list --porcelain output."""
-        service = GitService()
-        porcelain_output = (
-            "worktree /home/user/project\n"
-            "HEAD abc123def456\n"
-            "branch refs/heads/main\n"
-            "\n"
-            "worktree /home/user/project-worktrees/feature-x\n"
-            "HEAD def456abc789\n"
-            "branch refs/heads/feature-x\n"
-            "\n"
-        )
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.return_value = (porcelain_output, "", 0)
                 result = await service.list_worktrees(str(tmp_path))
 
-                assert len(result) == 2
-                assert result[0].path == "/home/user/project"
-                assert result[0].branch == "main"
-                assert result[0].commit == "abc123def456"
-                assert result[0].is_main is True
-                assert result[1].path == "/home/user/project-worktrees/feature-x"
-                assert result[1].branch == "feature-x"
-                assert result[1].is_main is False
-
-    @pytest.mark.asyncio
-    async def test_parses_detached_locked_and_prunable(self, tmp_path):
-        """list_worktrees parses detached/locked/prunable metadata."""
-        service = GitService()
-        porcelain_output = (
-            "worktree /home/user/project\n"
-            "HEAD abc123\n"
-            "branch refs/heads/main\n"
-            "\n"
-            "worktree /home/user/project-worktrees/detached\n"
-            "HEAD def456\n"
-            "detached\n"
-            "locked admin lock\n"
-            "prunable stale gitdir file\n"
-            "\n"
-        )
-        with patch.object(service, "validate_git_repo", return_value=True):
-            with patch.object(service, "_run_git_command") as mock_cmd:
-                mock_cmd.return_value = (porcelain_output, "", 0)
-                result = await service.list_worktrees(str(tmp_path))
-
-                assert len(result) == 2
-                assert result[1].branch == "(detached HEAD)"
-                assert result[1].is_detached is True
-                assert result[1].is_locked is True
-                assert result[1].lock_reason == "admin lock"
-                assert result[1].is_prunable is True
-                assert result[1].prunable_reason == "stale gitdir file"
-
-    @pytest.mark.asyncio
-    async def test_handles_single_worktree(self, tmp_path):
-        """list_worktrees works with just the main worktree."""
-        service = GitService()
-        porcelain_output = (
-            "worktree /home/user/project\n" "HEAD abc123\n" "branch refs/heads/main\n" "\n"
-        )
-        with patch.object(service, "validate_git_repo", return_value=True):
-            with patch.object(service, "_run_git_command") as mock_cmd:
-                mock_cmd.return_value = (porcelain_output, "", 0)
-                result = await service.list_worktrees(str(tmp_path))
-
-                assert len(result) == 1
-                assert result[0].is_main is True
-
-    @pytest.mark.asyncio
-    async def test_handles_no_trailing_newline(self, tmp_path):
-        """list_worktrees handles output without trailing blank line."""
-        service = GitService()
-        porcelain_output = "worktree /home/user/project\n" "HEAD abc123\n" "branch refs/heads/main"
-        with patch.object(service, "validate_git_repo", return_value=True):
-            with patch.object(service, "_run_git_command") as mock_cmd:
-                mock_cmd.return_value = (porcelain_output, "", 0)
-                result = await service.list_worktrees(str(tmp_path))
-
-                assert len(result) == 1
-                assert result[0].branch == "main"
-
-    @pytest.mark.asyncio
-    async def test_not_git_repo(self, tmp_path):
-        """list_worktrees raises GitError for non-repos."""
-        service = GitService()
-        with patch.object(service, "validate_git_repo", return_value=False):
-            with pytest.raises(GitError, match="Not a git repository"):
-                await service.list_worktrees(str(tmp_path))
+                assert result == expected
 
 
 class TestGetMainWorktree:
     """Tests for GitService.get_main_worktree."""
 
     @pytest.mark.asyncio
-    async def test_returns_first_worktree_path(self, tmp_path):
+    async def test_returns_first_worktree_path(self, tmp_path, service):
         """get_main_worktree returns the first worktree from porcelain output."""
-        service = GitService()
         porcelain_output = (
             "worktree /home/user/project\n"
             "HEAD abc123\n"
@@ -164,22 +161,13 @@ class TestGetMainWorktree:
                 result = await service.get_main_worktree(str(tmp_path))
                 assert result == "/home/user/project"
 
-    @pytest.mark.asyncio
-    async def test_not_git_repo(self, tmp_path):
-        """get_main_worktree raises GitError for non-repos."""
-        service = GitService()
-        with patch.object(service, "validate_git_repo", return_value=False):
-            with pytest.raises(GitError, match="Not a git repository"):
-                await service.get_main_worktree(str(tmp_path))
-
 
 class TestAddWorktree:
     """Tests for GitService.add_worktree."""
 
     @pytest.mark.asyncio
-    async def test_creates_worktree_for_new_branch(self, tmp_path):
+    async def test_creates_worktree_for_new_branch(self, tmp_path, service):
         """add_worktree creates a branch and worktree in the sibling directory."""
-        service = GitService()
         main_root = str(tmp_path / "project")
         expected_path = str(Path(main_root + "-worktrees") / "feature-x")
 
@@ -203,9 +191,8 @@ class TestAddWorktree:
                     )
 
     @pytest.mark.asyncio
-    async def test_adds_existing_branch_without_b_flag(self, tmp_path):
+    async def test_adds_existing_branch_without_b_flag(self, tmp_path, service):
         """add_worktree reuses branch when branch already exists."""
-        service = GitService()
         main_root = str(tmp_path / "project")
         expected_path = str(Path(main_root + "-worktrees") / "feature-x")
 
@@ -228,9 +215,8 @@ class TestAddWorktree:
                     )
 
     @pytest.mark.asyncio
-    async def test_add_with_from_ref_for_new_branch(self, tmp_path):
+    async def test_add_with_from_ref_for_new_branch(self, tmp_path, service):
         """add_worktree supports from_ref when creating a new branch."""
-        service = GitService()
         main_root = str(tmp_path / "project")
         expected_path = str(Path(main_root + "-worktrees") / "feature-x")
 
@@ -254,9 +240,8 @@ class TestAddWorktree:
                     )
 
     @pytest.mark.asyncio
-    async def test_add_with_from_ref_rejected_for_existing_branch(self, tmp_path):
+    async def test_add_with_from_ref_rejected_for_existing_branch(self, tmp_path, service):
         """add_worktree rejects --from for existing branches."""
-        service = GitService()
         main_root = str(tmp_path / "project")
 
         with patch.object(service, "get_main_worktree", return_value=main_root):
@@ -267,16 +252,8 @@ class TestAddWorktree:
                         await service.add_worktree(str(tmp_path), "feature-x", from_ref="main")
 
     @pytest.mark.asyncio
-    async def test_validates_branch_name(self, tmp_path):
-        """add_worktree validates branch name."""
-        service = GitService()
-        with pytest.raises(GitError, match="invalid character"):
-            await service.add_worktree(str(tmp_path), "feature branch")
-
-    @pytest.mark.asyncio
-    async def test_rejects_existing_path(self, tmp_path):
+    async def test_rejects_existing_path(self, tmp_path, service):
         """add_worktree raises error if worktree directory already exists."""
-        service = GitService()
         main_root = str(tmp_path / "project")
         existing_path = Path(main_root + "-worktrees") / "feature-x"
         existing_path.mkdir(parents=True)
@@ -290,9 +267,8 @@ class TestRemoveWorktree:
     """Tests for GitService.remove_worktree."""
 
     @pytest.mark.asyncio
-    async def test_removes_worktree(self, tmp_path):
+    async def test_removes_worktree(self, tmp_path, service):
         """remove_worktree calls git worktree remove."""
-        service = GitService()
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.return_value = ("", "", 0)
@@ -303,9 +279,8 @@ class TestRemoveWorktree:
                 )
 
     @pytest.mark.asyncio
-    async def test_force_remove(self, tmp_path):
+    async def test_force_remove(self, tmp_path, service):
         """remove_worktree with force adds --force flag."""
-        service = GitService()
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.return_value = ("", "", 0)
@@ -319,8 +294,7 @@ class TestBranchHelpers:
     """Tests for branch/prune helper methods."""
 
     @pytest.mark.asyncio
-    async def test_branch_exists_true_and_false(self, tmp_path):
-        service = GitService()
+    async def test_branch_exists_true_and_false(self, tmp_path, service):
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.side_effect = [
@@ -331,16 +305,14 @@ class TestBranchHelpers:
                 assert await service.branch_exists(str(tmp_path), "feature") is False
 
     @pytest.mark.asyncio
-    async def test_get_current_branch(self, tmp_path):
-        service = GitService()
+    async def test_get_current_branch(self, tmp_path, service):
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.return_value = ("feature-x", "", 0)
                 assert await service.get_current_branch(str(tmp_path)) == "feature-x"
 
     @pytest.mark.asyncio
-    async def test_prune_worktrees_dry_run(self, tmp_path):
-        service = GitService()
+    async def test_prune_worktrees_dry_run(self, tmp_path, service):
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.return_value = ("Removing stale", "", 0)
@@ -349,8 +321,7 @@ class TestBranchHelpers:
                 mock_cmd.assert_called_once_with(str(tmp_path), "worktree", "prune", "--dry-run")
 
     @pytest.mark.asyncio
-    async def test_delete_branch(self, tmp_path):
-        service = GitService()
+    async def test_delete_branch(self, tmp_path, service):
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.side_effect = [
@@ -371,9 +342,8 @@ class TestMergeBranch:
     """Tests for GitService.merge_branch."""
 
     @pytest.mark.asyncio
-    async def test_successful_merge(self, tmp_path):
+    async def test_successful_merge(self, tmp_path, service):
         """merge_branch returns (True, message) on success."""
-        service = GitService()
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.side_effect = [
@@ -385,9 +355,8 @@ class TestMergeBranch:
                 assert "Merge made" in message
 
     @pytest.mark.asyncio
-    async def test_detects_conflicts(self, tmp_path):
+    async def test_detects_conflicts(self, tmp_path, service):
         """merge_branch returns (False, details) on merge conflicts."""
-        service = GitService()
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.side_effect = [
@@ -401,9 +370,8 @@ class TestMergeBranch:
                 assert "2 file(s)" in message
 
     @pytest.mark.asyncio
-    async def test_non_conflict_failure(self, tmp_path):
+    async def test_non_conflict_failure(self, tmp_path, service):
         """merge_branch raises GitError on non-conflict failures."""
-        service = GitService()
         with patch.object(service, "validate_git_repo", return_value=True):
             with patch.object(service, "_run_git_command") as mock_cmd:
                 mock_cmd.side_effect = [
@@ -413,18 +381,29 @@ class TestMergeBranch:
                 with pytest.raises(GitError, match="Merge failed"):
                     await service.merge_branch(str(tmp_path), "nonexistent")
 
-    @pytest.mark.asyncio
-    async def test_validates_branch_name(self, tmp_path):
-        """merge_branch validates the branch name."""
-        service = GitService()
-        with patch.object(service, "validate_git_repo", return_value=True):
-            with pytest.raises(GitError, match="invalid character"):
-                await service.merge_branch(str(tmp_path), "feature branch")
 
+class TestSharedValidation:
+    """Repository and branch-name checks shared across GitService worktree methods."""
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("list_worktrees", ()),
+            ("get_main_worktree", ()),
+            ("merge_branch", ("feature-x",)),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_not_git_repo(self, tmp_path):
-        """merge_branch raises GitError for non-repos."""
-        service = GitService()
+    async def test_not_git_repo(self, tmp_path, service, method, args):
+        """Worktree methods raise GitError for non-repos."""
         with patch.object(service, "validate_git_repo", return_value=False):
             with pytest.raises(GitError, match="Not a git repository"):
-                await service.merge_branch(str(tmp_path), "feature-x")
+                await getattr(service, method)(str(tmp_path), *args)
+
+    @pytest.mark.parametrize("method", ["add_worktree", "merge_branch"])
+    @pytest.mark.asyncio
+    async def test_validates_branch_name(self, tmp_path, service, method):
+        """Branch-taking methods reject invalid branch names."""
+        with patch.object(service, "validate_git_repo", return_value=True):
+            with pytest.raises(GitError, match="invalid character"):
+                await getattr(service, method)(str(tmp_path), "feature branch")